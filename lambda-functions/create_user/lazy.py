@@ -0,0 +1,59 @@
+# lambda-functions/common/lazy.py
+"""
+Deferred imports and clients for Lambda cold starts.
+
+Copied next to each function's main.py by terraform (see lambdas.tf), like
+models.py. Module-level code in a handler runs on every cold start, so
+anything only some requests need should go through here:
+
+    from lazy import lazy_import, Lazy
+
+    brotli = lazy_import("brotli")          # imported on first attribute access
+    cognito = Lazy(lambda: boto3.client("cognito-idp"))  # created on first use
+
+tools/import_report.py shows what each function still imports eagerly.
+"""
+import importlib.util
+import sys
+import threading
+
+
+def lazy_import(name):
+    """
+    Module `name`, executed on first attribute access. Returns None when
+    the module is not installed, so optional dependencies can be checked
+    with `if module is None` without importing them.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class Lazy:
+    """
+    Proxy for an object built by `factory` on first attribute access,
+    e.g. a boto3 client only some code paths call.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._obj = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        if self._obj is None:
+            with self._lock:
+                if self._obj is None:
+                    self._obj = self._factory()
+        return self._obj
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
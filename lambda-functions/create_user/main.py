@@ -7,13 +7,14 @@ from datetime import datetime
 import uuid
 from pydantic import ValidationError
 from models.models import UserCreateModel
+from lazy import Lazy
 
 # DynamoDB table
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(os.environ["USERS_TABLE"])  # table_name from env var
 
-# Cognito client
-cognito = boto3.client("cognito-idp")
+# Cognito client, created on first use (not every request calls Cognito)
+cognito = Lazy(lambda: boto3.client("cognito-idp"))
 USER_POOL_ID = os.environ["USER_POOL_ID"]
 
 
@@ -0,0 +1,283 @@
+# lambda-functions/get_items/catalog.py
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import BotoCoreError, ClientError
+from metrics import metrics
+from ngram_index import NgramIndex
+from prefix_index import PrefixIndex
+from normalize import code_key, normalize_name
+from search_index import MappedCatalog
+
+dynamodb = boto3.resource("dynamodb")
+table = dynamodb.Table(os.environ["TABLE_NAME"])
+
+PROJECTION = "ID_TOWARU, NAZWA_TOWARU, NAZWA_TOWARU_NORM, DATA_UTWORZENIA, KOD_KRESKOWY, SYMBOL"
+
+# Parallel Scan: the table is split into SCAN_SEGMENTS segments, read by at
+# most SCAN_MAX_WORKERS threads
+SCAN_SEGMENTS = max(1, int(os.environ.get("SCAN_SEGMENTS", "4")))
+SCAN_MAX_WORKERS = max(1, int(os.environ.get("SCAN_MAX_WORKERS", "8")))
+
+# How long a warm container trusts its catalog before re-checking the version
+CATALOG_TTL_SECONDS = int(os.environ.get("CATALOG_TTL_SECONDS", "300"))
+# How soon to re-check after a failed check, while the old catalog is served
+CATALOG_RETRY_SECONDS = int(os.environ.get("CATALOG_RETRY_SECONDS", "15"))
+
+# Optional prebuilt index (tools/build_search_index.py), mmapped at cold start
+SEARCH_INDEX_PATH = os.environ.get("SEARCH_INDEX_PATH", "")
+
+# Sparse GSI holding only the latest revision of each product (keyed by
+# ID_TOWARU_AKT, which ingestion keeps on that revision alone). When set,
+# catalog Scans and ID lookups read it instead of every historical row.
+CATALOG_INDEX = os.environ.get("CATALOG_INDEX", "")
+
+# Meta item bumped by ingestion whenever `towary` changes. It has no
+# NAZWA_TOWARU, so the catalog scan skips it like any other nameless row.
+CATALOG_VERSION_KEY = {"ID_TOWARU": 0, "DATA_MODYFIKACJI": "CATALOG_VERSION"}
+
+
+def parse_iso(dt: str):
+    if not dt:
+        return None
+    dt = dt.replace("Z", "+00:00").replace(" ", "T")
+    try:
+        return datetime.fromisoformat(dt)
+    except Exception:
+        return None
+
+
+def _created(item):
+    return parse_iso(item.get("DATA_UTWORZENIA", "")) or datetime.min
+
+
+class Catalog:
+    """
+    Searchable snapshot of `towary`: the latest item per ID_TOWARU,
+    grouped by normalized name.
+    """
+
+    source = "scan"
+
+    def __init__(self, name_to_items, version=None):
+        self.version = version
+        self.name_to_items = name_to_items
+        self.names = list(name_to_items.keys())
+        self.item_count = sum(len(v) for v in name_to_items.values())
+
+    @classmethod
+    def from_items(cls, items, version=None):
+        # Latest item per ID_TOWARU. Dates are only compared for IDs seen
+        # more than once, which with CATALOG_INDEX is next to none.
+        latest_by_id = {}
+        with metrics.phase("dedupe"):
+            for it in items:
+                id_towaru = it.get("ID_TOWARU")
+                if not id_towaru:
+                    continue
+                seen = latest_by_id.get(id_towaru)
+                if seen is None or _created(seen) < _created(it):
+                    latest_by_id[id_towaru] = it
+
+        # Build lookup by normalized name (precomputed at ingestion when available)
+        name_to_items = {}
+        with metrics.phase("normalize"):
+            for it in latest_by_id.values():
+                name_norm = it.pop("NAZWA_TOWARU_NORM", None) or normalize_name(it.get("NAZWA_TOWARU"))
+                if not name_norm:
+                    continue
+                name_to_items.setdefault(name_norm, []).append(it)
+        metrics.count("distinct_names", len(name_to_items))
+
+        return cls(name_to_items, version=version)
+
+    @cached_property
+    def ngrams(self):
+        return NgramIndex(self.names)
+
+    @cached_property
+    def prefix(self):
+        return PrefixIndex(self.names)
+
+    @cached_property
+    def codes(self):
+        # code_key(KOD_KRESKOWY / SYMBOL) -> items
+        codes = {}
+        for items in self.name_to_items.values():
+            for it in items:
+                for field in ("KOD_KRESKOWY", "SYMBOL"):
+                    key = code_key(it.get(field))
+                    if key:
+                        codes.setdefault(key, []).append(it)
+        return codes
+
+    def items_for(self, name_norm):
+        return self.name_to_items.get(name_norm, [])
+
+    def items_for_code(self, code):
+        return self.codes.get(code_key(code), [])
+
+
+def read_catalog_version():
+    """
+    Return the catalog version written by ingestion, or None if the table
+    does not carry one.
+    """
+    resp = table.get_item(Key=CATALOG_VERSION_KEY, ProjectionExpression="VERSION")
+    return (resp.get("Item") or {}).get("VERSION")
+
+
+_deserializer = TypeDeserializer()
+
+
+def deserialize_item(item):
+    """
+    Low-level (wire format) item to plain Python values. Strings stay str
+    and integers become int instead of TypeDeserializer's Decimal, which
+    is several times faster per item and what the JSON output wants
+    anyway (ID_TOWARU, KOD_KRESKOWY). Fractional numbers stay Decimal;
+    other types go through TypeDeserializer.
+    """
+    out = {}
+    for k, v in item.items():
+        if "S" in v:
+            out[k] = v["S"]
+        elif "N" in v:
+            n = v["N"]
+            out[k] = int(n) if n.isdigit() else _deserializer.deserialize(v)
+        else:
+            out[k] = _deserializer.deserialize(v)
+    return out
+
+
+def get_item_by_id(id_towaru):
+    """
+    Latest named item for one ID_TOWARU, read with a Query on the hash key
+    instead of the catalog. Returns None when the ID does not exist.
+    """
+    key = {"IndexName": CATALOG_INDEX, "KeyConditionExpression": "ID_TOWARU_AKT = :id"} \
+        if CATALOG_INDEX else {"KeyConditionExpression": "ID_TOWARU = :id"}
+    resp = table.meta.client.query(
+        TableName=table.name,
+        ExpressionAttributeValues={":id": {"N": str(id_towaru)}},
+        ProjectionExpression=PROJECTION,
+        **key,
+    )
+    items = [deserialize_item(it) for it in resp.get("Items", [])]
+    return max((it for it in items if it.get("NAZWA_TOWARU")), key=_created, default=None)
+
+
+def scan_page(**scan_kwargs):
+    """
+    Read one Scan page of the catalog projection (from CATALOG_INDEX when
+    set). Returns the deserialized items and the raw (low-level)
+    LastEvaluatedKey, which is JSON-safe.
+    """
+    if CATALOG_INDEX:
+        scan_kwargs["IndexName"] = CATALOG_INDEX
+    # The low-level client is thread-safe, unlike the Table resource
+    with metrics.phase("scan"):
+        resp = table.meta.client.scan(
+            TableName=table.name,
+            ProjectionExpression=PROJECTION,
+            **scan_kwargs,
+        )
+    with metrics.phase("deserialize"):
+        items = [deserialize_item(it) for it in resp.get("Items", [])]
+    metrics.count("pages_read")
+    metrics.count("items_scanned", len(items))
+    return items, resp.get("LastEvaluatedKey")
+
+
+def _scan_segment(segment, total_segments):
+    items = []
+    scan_kwargs = {"Segment": segment, "TotalSegments": total_segments}
+    while True:
+        batch, lek = scan_page(**scan_kwargs)
+        items.extend(batch)
+        if not lek:
+            break
+        scan_kwargs["ExclusiveStartKey"] = lek
+    return items
+
+
+def scan_catalog(version=None):
+    """
+    Read the whole table with a parallel segmented Scan.
+    """
+    items = []
+    workers = min(SCAN_SEGMENTS, SCAN_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_segment, seg, SCAN_SEGMENTS)
+                   for seg in range(SCAN_SEGMENTS)]
+        for fut in futures:
+            items.extend(fut.result())
+    return Catalog.from_items(items, version=version)
+
+
+def _load_catalog(version):
+    if SEARCH_INDEX_PATH and os.path.exists(SEARCH_INDEX_PATH):
+        try:
+            index = MappedCatalog(SEARCH_INDEX_PATH)
+        except ValueError as e:
+            # e.g. a file from an older build_search_index.py: rebuild it, Scan meanwhile
+            print(json.dumps({"level": "WARNING", "message": "search index ignored", "error": str(e)}))
+            index = None
+        if index is not None and (version is None or index.version == version):
+            return index
+    return scan_catalog(version)
+
+
+def _is_stale(catalog, version):
+    if catalog is None:
+        return True
+    if version is None:
+        # Without a stored version only a prebuilt index can be trusted
+        return catalog.source != "index"
+    return version != catalog.version
+
+
+# Survives across warm invocations of the same container
+_catalog = None
+_catalog_expires_at = 0.0
+
+
+def get_catalog(refresh=False):
+    """
+    Return the cached catalog, reloading it only when the TTL has expired
+    (or `refresh` is set) and the stored catalog version no longer matches
+    (or is unknown). A prebuilt index is used instead of a Scan while its
+    version matches.
+
+    When the check or the reload fails (throttling, a transient DynamoDB
+    error) and a catalog is already cached, that catalog keeps being served
+    and the check is retried after CATALOG_RETRY_SECONDS.
+    """
+    global _catalog, _catalog_expires_at
+
+    now = time.monotonic()
+    if _catalog is not None and now < _catalog_expires_at and not refresh:
+        return _catalog
+
+    try:
+        with metrics.phase("catalog_version"):
+            version = read_catalog_version()
+        if _is_stale(_catalog, version):
+            metrics.count("catalog_loads")
+            _catalog = _load_catalog(version)
+    except (BotoCoreError, ClientError) as e:
+        if _catalog is None:
+            raise
+        print(json.dumps({"level": "WARNING", "message": "catalog check failed, serving the cached catalog",
+                          "catalog_version": _catalog.version, "error": str(e)}))
+        metrics.count("catalog_check_errors")
+        _catalog_expires_at = time.monotonic() + CATALOG_RETRY_SECONDS
+        return _catalog
+
+    _catalog_expires_at = time.monotonic() + CATALOG_TTL_SECONDS
+    return _catalog
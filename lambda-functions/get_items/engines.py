@@ -0,0 +1,149 @@
+# lambda-functions/get_items/engines.py
+"""
+Search engines behind the cached-catalog path of get_items.
+
+An engine is built from a catalog snapshot, rebuilt when the snapshot
+changes (refresh) and answers search(term_norm, cutoff, limit) with
+(normalized name, score) pairs, best first. SEARCH_ENGINE picks one:
+
+    rapidfuzz   ranker over the in-memory names, narrowed by the exact
+                trigram shortlist on large catalogs (NGRAM_SHORTLIST) (default)
+    fts5        SQLite FTS5 trigram database in /tmp; bm25 picks the top
+                FTS5_CANDIDATES names, rapidfuzz re-ranks them
+
+The per-request Scan path (cursors, CATALOG_CACHE=false) does not use an
+engine.
+"""
+import os
+from abc import ABC, abstractmethod
+from rapidfuzz import process, fuzz
+from lazy import lazy_import
+from metrics import metrics
+from ngram_index import ngrams, shortlist_enabled
+from ranker import rank
+
+sqlite3 = lazy_import("sqlite3")  # only the fts5 engine uses it
+
+SEARCH_ENGINE = os.environ.get("SEARCH_ENGINE", "rapidfuzz").lower()
+FTS5_PATH = os.environ.get("FTS5_PATH", "/tmp/get_items_fts.sqlite")
+FTS5_CANDIDATES = int(os.environ.get("FTS5_CANDIDATES", "300"))
+
+
+class SearchEngine(ABC):
+    name = None
+
+    def __init__(self):
+        self.catalog = None
+
+    def build(self, catalog):
+        self.catalog = catalog
+
+    def refresh(self, catalog):
+        """
+        Rebuild for `catalog` unless already built from it; True if rebuilt.
+        """
+        if catalog is self.catalog:
+            return False
+        self.build(catalog)
+        return True
+
+    @abstractmethod
+    def search(self, term_norm, cutoff, limit):
+        """
+        (normalized name, score) pairs for `term_norm`, best first.
+        """
+
+
+class RapidfuzzEngine(SearchEngine):
+    name = "rapidfuzz"
+
+    def search(self, term_norm, cutoff, limit):
+        # Names that can still make the top `limit`; None means a full pass
+        shortlist = None
+        if shortlist_enabled(self.catalog.names):
+            with metrics.phase("shortlist"):
+                shortlist = self.catalog.ngrams.shortlist(term_norm, cutoff, limit)
+        choices = self.catalog.names if shortlist is None else shortlist
+        metrics.count("candidates", len(choices))
+        with metrics.phase("fuzzy"):
+            matches = rank(term_norm, choices, cutoff, limit)
+        return [(name, score) for name, score, _ in matches]
+
+
+class Fts5Engine(SearchEngine):
+    name = "fts5"
+
+    def __init__(self, path=FTS5_PATH, candidates=FTS5_CANDIDATES):
+        super().__init__()
+        self.path = path
+        self.candidates = candidates
+        self._db = None
+
+    def build(self, catalog):
+        tmp = f"{self.path}.building"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        db = sqlite3.connect(tmp)
+        try:
+            # Contentless: rowid is the position in catalog.names
+            db.execute("CREATE VIRTUAL TABLE names USING fts5(name, tokenize='trigram', content='')")
+            db.executemany("INSERT INTO names(rowid, name) VALUES (?, ?)", enumerate(catalog.names))
+            db.commit()
+        finally:
+            db.close()
+        os.replace(tmp, self.path)
+
+        if self._db is not None:
+            self._db.close()
+        self._db = sqlite3.connect(self.path)
+        self.catalog = catalog
+
+    def _candidates(self, term_norm):
+        with metrics.phase("shortlist"):
+            return self._fts_candidates(term_norm)
+
+    def _fts_candidates(self, term_norm):
+        # Padded edge trigrams (" ml") never occur in the indexed text
+        grams = [g for g in ngrams(term_norm) if len(g.strip()) == 3]
+        if not grams:
+            return None
+        # FTS5 string literals escape " by doubling it
+        match = " OR ".join('"' + g.replace('"', '""') + '"' for g in sorted(grams))
+        rows = self._db.execute(
+            "SELECT rowid FROM names WHERE names MATCH ? ORDER BY rank LIMIT ?",
+            (match, self.candidates),
+        ).fetchall()
+        return [self.catalog.names[rowid] for rowid, in rows]
+
+    def search(self, term_norm, cutoff, limit):
+        choices = self._candidates(term_norm)
+        if choices is None:
+            # Under three characters there is no trigram to look up
+            choices = self.catalog.names
+        with metrics.phase("fuzzy"):
+            matches = process.extract(
+                term_norm,
+                choices,
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=cutoff,
+                limit=limit,
+            ) if choices else []
+        return [(name, score) for name, score, _ in matches]
+
+
+ENGINES = {engine.name: engine for engine in (RapidfuzzEngine, Fts5Engine)}
+
+_engine = None
+
+
+def get_engine(catalog):
+    """
+    The configured engine, built from (or refreshed to) `catalog`.
+    """
+    global _engine
+    if _engine is None:
+        if SEARCH_ENGINE not in ENGINES:
+            raise ValueError(f"Unknown SEARCH_ENGINE {SEARCH_ENGINE!r}")
+        _engine = ENGINES[SEARCH_ENGINE]()
+    _engine.refresh(catalog)
+    return _engine
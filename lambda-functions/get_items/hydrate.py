@@ -0,0 +1,89 @@
+# lambda-functions/get_items/hydrate.py
+"""
+Stock and price hydration for search results (`include=stock,price`).
+
+Both tables are keyed by ID_TOWARU plus a range key that a search result
+does not know: akt_stan_mag by ID_MAGAZYNU (whichever warehouses hold the
+product), ceny_towarow by TS. So each product's rows are read with a
+hash-key Query, run concurrently across the results: every stock row, and
+the price row with the highest TS.
+
+"stock" is the list of per-warehouse rows, or None when akt_stan_mag has
+no row for the product at all (unknown, as opposed to rows with ILOSC 0).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.types import TypeDeserializer
+import catalog
+
+STOCK_TABLE_NAME = os.environ.get("STOCK_TABLE_NAME", "akt_stan_mag")
+PRICE_TABLE_NAME = os.environ.get("PRICE_TABLE_NAME", "ceny_towarow")
+HYDRATE_WORKERS = int(os.environ.get("HYDRATE_WORKERS", "8"))
+
+STOCK_PROJECTION = "ID_MAGAZYNU, ILOSC, ILOSC_ZAREZERWOWANA"
+# Sale price only: purchase price and margin stay internal
+PRICE_PROJECTION = "ID_TOWARU, CENA, UPUST"
+
+_deserializer = TypeDeserializer()
+
+
+def _deserialize(item):
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def _stock_rows(id_towaru):
+    """
+    All akt_stan_mag rows of a product, by warehouse, or None without any.
+    """
+    kwargs = {
+        "TableName": STOCK_TABLE_NAME,
+        "KeyConditionExpression": "ID_TOWARU = :id",
+        "ExpressionAttributeValues": {":id": {"N": str(id_towaru)}},
+        "ProjectionExpression": STOCK_PROJECTION,
+    }
+    rows = []
+    while True:
+        resp = catalog.table.meta.client.query(**kwargs)
+        rows.extend(_deserialize(it) for it in resp.get("Items") or [])
+        if not resp.get("LastEvaluatedKey"):
+            break
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+    return sorted(rows, key=lambda row: row["ID_MAGAZYNU"]) if rows else None
+
+
+def _latest_price(id_towaru):
+    resp = catalog.table.meta.client.query(
+        TableName=PRICE_TABLE_NAME,
+        KeyConditionExpression="ID_TOWARU = :id",
+        ExpressionAttributeValues={":id": {"N": str(id_towaru)}},
+        ProjectionExpression=PRICE_PROJECTION,
+        ScanIndexForward=False,  # highest TS first
+        Limit=1,
+    )
+    items = resp.get("Items") or []
+    return _deserialize(items[0]) if items else None
+
+
+def hydrate(results, include):
+    """
+    Add "stock" (list of per-warehouse rows, None without any) and/or
+    "price" to each result in place.
+    """
+    ids = list(dict.fromkeys(int(r["ID_TOWARU"]) for r in results))
+    if not ids:
+        return results
+
+    with ThreadPoolExecutor(max_workers=HYDRATE_WORKERS) as pool:
+        stock_futures = {i: pool.submit(_stock_rows, i) for i in ids} if "stock" in include else {}
+        price_futures = {i: pool.submit(_latest_price, i) for i in ids} if "price" in include else {}
+        stock_by_id = {i: fut.result() for i, fut in stock_futures.items()}
+        price_by_id = {i: fut.result() for i, fut in price_futures.items()}
+
+    for r in results:
+        id_t = int(r["ID_TOWARU"])
+        if "stock" in include:
+            r["stock"] = stock_by_id.get(id_t)
+        if "price" in include:
+            price = price_by_id.get(id_t)
+            r["price"] = {k: v for k, v in price.items() if k != "ID_TOWARU"} if price else None
+    return results
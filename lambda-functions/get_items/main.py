@@ -1,41 +1,335 @@
 # lambda-functions/get_items/main.py
 import os
+import base64
+import hashlib
+import time
 from decimal import Decimal
-import unicodedata
+import rapidfuzz
 from rapidfuzz import process, fuzz
-import boto3, json
-from datetime import datetime
-from models.models import GetItemsQueryModel  # <- Pydantic model
+import json
+from catalog import get_catalog, get_item_by_id
+from engines import get_engine
+from hydrate import hydrate
+from lazy import lazy_import
+from metrics import metrics
+from ngram_index import shortlist_enabled
+from normalize import normalize_name
+from query_cache import QueryCache
+from scan_search import InvalidCursor, scan_deadline, scan_search
+from models.models import GetItemsQueryModel, GetItemsBatchModel  # <- Pydantic models
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+# Only compressed responses need these; brotli is None unless the layer ships it
+gzip = lazy_import("gzip")
+brotli = lazy_import("brotli")
+# Only batch requests need numpy
+np = lazy_import("numpy")
 
-PROJECTION = "ID_TOWARU, NAZWA_TOWARU, DATA_UTWORZENIA"
-MAX_SCAN_PAGES = int(os.environ.get("SCAN_PAGE_LIMIT", "3"))
-MAX_SCAN_ITEMS = int(os.environ.get("SCAN_ITEM_LIMIT", "8000"))
+# "false" searches the table page by page on every request (resumable via cursor)
+CATALOG_CACHE = os.environ.get("CATALOG_CACHE", "true").lower() != "false"
+
+# Browser/CDN freshness of search responses; revalidation uses the ETag
+CACHE_MAX_AGE_SECONDS = int(os.environ.get("CACHE_MAX_AGE_SECONDS", "60"))
+
+# Bodies at least this large are gzip/brotli-compressed when the client accepts it
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", "1024"))
+
+# rapidfuzz cdist threads for batch requests (-1 = all cores)
+BATCH_WORKERS = int(os.environ.get("BATCH_WORKERS", "-1"))
+
+def _rapidfuzz_backend():
+    # fuzz_cpp_avx2 / fuzz_cpp_sse2 / fuzz_cpp are native, fuzz_py is the pure-Python fallback
+    mod = getattr(fuzz.token_set_ratio, "__module__", "") or ""
+    impl = mod.rsplit(".", 1)[-1]
+    return impl[len("fuzz_"):] if impl.startswith("fuzz_cpp") else "python"
+
+RAPIDFUZZ_BACKEND = _rapidfuzz_backend()
+
+# One structured line per cold start, so a shadowed native build shows up in the logs
+print(json.dumps({
+    "level": "WARNING" if RAPIDFUZZ_BACKEND == "python" else "INFO",
+    "message": "rapidfuzz backend",
+    "rapidfuzz_backend": RAPIDFUZZ_BACKEND,
+    "rapidfuzz_version": getattr(rapidfuzz, "__version__", None),
+    "rapidfuzz_path": os.path.dirname(rapidfuzz.__file__ or ""),
+}))
+
+# Final response bodies of popular queries, per catalog snapshot
+query_cache = QueryCache()
 
 def _json_default(o):
     if isinstance(o, Decimal):
         return int(o) if o % 1 == 0 else float(o)
     raise TypeError
 
-def _strip_accents(s: str) -> str:
-    if not s:
-        return ""
-    return "".join(ch for ch in unicodedata.normalize("NFKD", s)
-                   if not unicodedata.combining(ch)).lower()
+def _http_method(event):
+    # HTTP API v2 carries the method in requestContext, REST API v1 at the top level
+    http = ((event or {}).get("requestContext") or {}).get("http") or {}
+    return (http.get("method") or (event or {}).get("httpMethod") or "GET").upper()
 
-def _parse_iso(dt: str):
-    if not dt:
+def _header(event, name):
+    # HTTP API v2 lower-cases header names, REST API v1 keeps the client's casing
+    for k, v in ((event or {}).get("headers") or {}).items():
+        if k.lower() == name:
+            return v
+    return None
+
+def _etag(*parts):
+    return '"' + hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:32] + '"'
+
+def _etag_matches(event, etag):
+    """
+    Return the If-None-Match tag that matches `etag` (ignoring W/ and the
+    content-coding suffix added by _compress_response), or None.
+    """
+    inm = _header(event, "if-none-match")
+    if not inm:
         return None
-    dt = dt.replace("Z", "+00:00").replace(" ", "T")
+    for tag in (t.strip() for t in inm.split(",")):
+        if tag == "*":
+            return etag
+        bare = tag[2:] if tag.startswith("W/") else tag
+        for suffix in ('-gzip"', '-br"'):
+            if bare.endswith(suffix):
+                bare = bare[:-len(suffix)] + '"'
+        if bare == etag:
+            return tag
+    return None
+
+def _accepted_encoding(event):
+    # Best supported coding from Accept-Encoding, honouring q=0
+    accepted = {}
+    for part in (_header(event, "accept-encoding") or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    for coding in (("br",) if brotli else ()) + ("gzip",):
+        if accepted.get(coding, accepted.get("*", 0)) > 0:
+            return coding
+    return None
+
+def _compress_response(event, response):
+    body = response.get("body")
+    if response.get("statusCode") != 200 or not isinstance(body, str) or len(body) < COMPRESS_MIN_BYTES:
+        return response
+    headers = response.setdefault("headers", {})
+    headers["Vary"] = "Accept-Encoding"
+    coding = _accepted_encoding(event)
+    if coding is None:
+        return response
+
+    data = body.encode("utf-8")
+    data = brotli.compress(data, quality=5) if coding == "br" else gzip.compress(data, compresslevel=6)
+    headers["Content-Encoding"] = coding
+    if "ETag" in headers:
+        # A strong validator must differ per content-coding
+        headers["ETag"] = headers["ETag"][:-1] + f'-{coding}"'
+    response["body"] = base64.b64encode(data).decode("ascii")
+    response["isBase64Encoded"] = True
+    return response
+
+def _cache_headers(etag):
+    return {"ETag": etag, "Cache-Control": f"public, max-age={CACHE_MAX_AGE_SECONDS}"}
+
+def _not_modified(etag):
+    return {
+        "statusCode": 304,
+        "headers": {"Access-Control-Allow-Origin": "*", **_cache_headers(etag)},
+    }
+
+def _format_results(catalog, match_names):
+    # Catalog already holds the latest item per ID_TOWARU
+    results = []
+    with metrics.phase("format"):
+        for match_name in match_names:
+            for v in catalog.items_for(match_name):
+                results.append({
+                    "ID_TOWARU": v.get("ID_TOWARU"),
+                    "NAZWA_TOWARU": v.get("NAZWA_TOWARU"),
+                })
+    metrics.count("matches", len(results))
+    return results
+
+def _search_body(results, next_cursor):
+    with metrics.phase("json_encode"):
+        return json.dumps({
+            "results": results,
+            "next_cursor": next_cursor
+        }, default=_json_default)
+
+def _search_response(body, partial=False, headers=None):
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": "*",
+            "X-Partial-Results": "true" if partial else "false",
+            "X-Rapidfuzz-Backend": RAPIDFUZZ_BACKEND,
+            **(headers or {}),
+        },
+        "body": body,
+    }
+
+def _search_catalog(catalog, term_norm, cutoff, limit):
+    # Fuzzy match with the configured engine (SEARCH_ENGINE)
+    matches = get_engine(catalog).search(term_norm, max(0, min(cutoff, 100)), limit)
+
+    results = _format_results(catalog, [match_name for match_name, _ in matches])
+    return _search_body(results, None)
+
+def _exact_results(catalog, query, limit):
+    """
+    Scanner input: an ID_TOWARU (key Query) or a barcode / SYMBOL (the
+    catalog's code index). Returns the exact hits, ID first, or [] when
+    fuzzy search should run instead.
+    """
+    code = query.strip()
+    if not code or len(code.split()) > 1:
+        return []
+
+    found = []
+    with metrics.phase("exact"):
+        # 0 is the CATALOG_VERSION meta item; DynamoDB numbers have at most 38 digits
+        # isdigit() also accepts "²" or "①", which int() rejects
+        if code.isascii() and code.isdecimal() and 0 < int(code) and len(code) <= 38:
+            item = get_item_by_id(int(code))
+            if item:
+                found.append(item)
+        if catalog is not None:
+            found.extend(catalog.items_for_code(code))
+
+    results, seen = [], set()
+    for it in found:
+        if int(it["ID_TOWARU"]) not in seen:
+            seen.add(int(it["ID_TOWARU"]))
+            results.append({"ID_TOWARU": it["ID_TOWARU"], "NAZWA_TOWARU": it.get("NAZWA_TOWARU")})
+    return results[:limit]
+
+def _complete_catalog(catalog, term_norm, limit):
+    # Typeahead: word-prefix completions from the sorted token index, no scoring
+    with metrics.phase("prefix"):
+        names = catalog.prefix.complete(term_norm, limit)
+    return _search_body(_format_results(catalog, names), None)
+
+def _batch_search(event):
+    body = event.get("body") or "{}"
+    if event.get("isBase64Encoded"):
+        body = base64.b64decode(body).decode("utf-8")
+
+    # Validate body via Pydantic
     try:
-        return datetime.fromisoformat(dt)
-    except Exception:
-        return None
+        batch_model = GetItemsBatchModel(**json.loads(body))
+    except Exception as ve:
+        return {
+            "statusCode": 400,
+            "body": ve.json() if hasattr(ve, "json") else str(ve)
+        }
+
+    cutoff = max(0, min(batch_model.cutoff, 100))
+    limit = batch_model.limit
+    catalog = get_catalog()
+    terms = [normalize_name(q.strip().lower()) for q in batch_model.queries]
+
+    # Score all queries in one cdist call against the union of their shortlists
+    choices = {}
+    use_shortlist = shortlist_enabled(catalog.names)
+    for term in filter(None, terms):
+        shortlist = catalog.ngrams.shortlist(term, cutoff, limit) if use_shortlist else None
+        if shortlist is None:
+            choices = dict.fromkeys(catalog.names)
+            break
+        choices.update(dict.fromkeys(shortlist))
+    # Catalog order, so equal scores rank as in a full pass
+    choices = list(choices) if len(choices) == len(catalog.names) \
+        else [name for name in catalog.names if name in choices]
+
+    with metrics.phase("fuzzy"):
+        scores = process.cdist(
+            terms,
+            choices,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=cutoff,
+            dtype=np.float32,
+            workers=BATCH_WORKERS,
+        ) if choices else None
+
+    # Per-query top-k, best score first (ties keep catalog order, like process.extract)
+    results = []
+    for i, (query, term) in enumerate(zip(batch_model.queries, terms)):
+        match_names = []
+        if term and scores is not None:
+            row = scores[i]
+            top = np.flatnonzero(row >= cutoff)
+            top = top[np.argsort(-row[top], kind="stable")][:limit]
+            match_names = [choices[j] for j in top]
+        results.append({
+            "query": query,
+            "results": _format_results(catalog, match_names),
+        })
+
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": "*",
+            "X-Rapidfuzz-Backend": RAPIDFUZZ_BACKEND,
+        },
+        "body": json.dumps({"results": results}, default=_json_default),
+    }
+
+def _is_warmup(event):
+    # Target input of the warm-up rule, or a bare EventBridge scheduled event
+    event = event or {}
+    return event.get("warmup") is True or event.get("detail-type") == "Scheduled Event"
+
+def _warm_up():
+    """
+    Load (or re-check) the catalog and build its lookup structures, so the
+    next user request on this container does no setup work.
+    """
+    started = time.perf_counter()
+    catalog = get_catalog(refresh=True)
+    with metrics.phase("indexes"):
+        indexes = ("ngrams", "codes", "prefix") if shortlist_enabled(catalog.names) else ("codes", "prefix")
+        for index in indexes:
+            getattr(catalog, index)  # cached_property: built once per catalog
+    with metrics.phase("engine"):
+        engine = get_engine(catalog)
+    result = {
+        "warmup": True,
+        "engine": engine.name,
+        "catalog_source": catalog.source,
+        "catalog_version": catalog.version,
+        "names": len(catalog.names),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    metrics.set(**result)
+    return result
 
 def lambda_handler(event, context):
+    metrics.reset()
+    try:
+        if _is_warmup(event):
+            metrics.route = "warmup"
+            return _warm_up()
+        response = _handle_request(event, context)
+        with metrics.phase("compress"):
+            response = _compress_response(event, response)
+        metrics.set(status=response.get("statusCode"))
+        return response
+    finally:
+        metrics.emit()
+
+def _handle_request(event, context):
     try:
+        if _http_method(event) == "POST":
+            metrics.route = "batch"
+            return _batch_search(event)
+
         qs = (event or {}).get("queryStringParameters") or {}
 
         # Validate query params via Pydantic
@@ -58,82 +352,87 @@ def lambda_handler(event, context):
                 "body": json.dumps({"error": "Missing 'query' parameter."}),
             }
 
-        # Scan DynamoDB
-        items = []
-        scan_kwargs = {"ProjectionExpression": PROJECTION}
-        pages = 0
-        while True:
-            resp = table.scan(**scan_kwargs)
-            batch = resp.get("Items", [])
-            items.extend(batch)
-
-            pages += 1
-            if len(items) >= MAX_SCAN_ITEMS or pages >= MAX_SCAN_PAGES:
-                break
-
-            lek = resp.get("LastEvaluatedKey")
-            if not lek:
-                break
-            scan_kwargs["ExclusiveStartKey"] = lek
-
-        # Build lookup by normalized name
-        name_to_items = {}
-        for it in items:
-            name_norm = _strip_accents((it.get("NAZWA_TOWARU") or "").strip())
-            if not name_norm:
-                continue
-            name_to_items.setdefault(name_norm, []).append(it)
-
-        term_norm = _strip_accents(term)
-
-        # Fuzzy match
-        matches = process.extract(
-            term_norm,
-            list(name_to_items.keys()),
-            scorer=fuzz.token_set_ratio,
-            score_cutoff=max(0, min(cutoff, 100)),
-            limit=limit,
-        ) if name_to_items else []
-
-        # Latest item per ID_TOWARU
-        latest_by_id = {}
-        for match_name, score, _ in matches:
-            for it in name_to_items.get(match_name, []):
-                id_towaru = it.get("ID_TOWARU")
-                dt = _parse_iso(it.get("DATA_UTWORZENIA", ""))
-                cur = latest_by_id.get(id_towaru)
-                if id_towaru and (cur is None or _parse_iso(cur.get("DATA_UTWORZENIA", "")) < dt):
-                    latest_by_id[id_towaru] = it
-
-        # Format results
-        seen = set()
-        results = []
-        for match_name, _, _ in matches:
-            for it in name_to_items.get(match_name, []):
-                id_t = it.get("ID_TOWARU")
-                if id_t in latest_by_id and id_t not in seen:
-                    v = latest_by_id[id_t]
-                    results.append({
-                        "ID_TOWARU": v.get("ID_TOWARU"),
-                        "NAZWA_TOWARU": v.get("NAZWA_TOWARU"),
-                    })
-                    seen.add(id_t)
-
-        partial = pages >= MAX_SCAN_PAGES or len(items) >= MAX_SCAN_ITEMS
-        next_cursor = resp.get("LastEvaluatedKey") if partial else None
+        term_norm = normalize_name(term)
+        include = set(query_model.include.split(",")) if query_model.include else set()
+        prefix_mode = query_model.mode == "prefix"
 
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "X-Partial-Results": "true" if partial else "false",
-            },
-            "body": json.dumps({
-                "results": results,
-                "next_cursor": next_cursor
-            }, default=_json_default),
-        }
+        if prefix_mode and query_model.cursor:
+            return {
+                "statusCode": 400,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps({"error": "'cursor' is not supported with mode=prefix."}),
+            }
+
+        # Prefix mode always answers from the catalog: a per-request Scan is far too slow per keystroke
+        if not prefix_mode and (query_model.cursor or not CATALOG_CACHE):
+            metrics.route = "scan"
+            exact = [] if query_model.cursor else _exact_results(None, query_model.query, limit)
+            if exact:
+                metrics.route = "exact"
+                if include:
+                    with metrics.phase("hydrate"):
+                        hydrate(exact, include)
+                return _search_response(_search_body(exact, None))
+            try:
+                results, next_cursor = scan_search(
+                    term_norm, max(0, min(cutoff, 100)), limit, query_model.cursor,
+                    deadline=scan_deadline(context))
+            except InvalidCursor as e:
+                return {
+                    "statusCode": 400,
+                    "headers": {"Content-Type": "application/json"},
+                    "body": json.dumps({"error": str(e)}),
+                }
+            if include:
+                with metrics.phase("hydrate"):
+                    hydrate(results, include)
+            return _search_response(_search_body(results, next_cursor), partial=bool(next_cursor))
+
+        metrics.route = "prefix" if prefix_mode else "search"
+        catalog = get_catalog()
+        metrics.set(catalog_source=catalog.source)
+        if prefix_mode:
+            cutoff = None  # not used for completions; keeps one cache entry per prefix
+
+        # With a catalog version the ETag is known before any search work
+        etag = _etag(catalog.version, query_model.mode, term_norm, cutoff, limit) \
+            if catalog.version and not include else None
+        matched = _etag_matches(event, etag) if etag else None
+        if matched:
+            return _not_modified(matched)
+
+        cache_key = (query_model.mode, term_norm, cutoff, limit)
+        body = query_cache.get(catalog, cache_key)
+        cache_status = "HIT"
+        if body is None:
+            cache_status = "MISS"
+            exact = [] if prefix_mode else _exact_results(catalog, query_model.query, limit)
+            if exact:
+                metrics.route = "exact"
+                body = _search_body(exact, None)
+            elif prefix_mode:
+                body = _complete_catalog(catalog, term_norm, limit)
+            else:
+                body = _search_catalog(catalog, term_norm, cutoff, limit)
+            query_cache.put(catalog, cache_key, body)
+        # Per-request HIT/MISS, plus the container's totals since cold start
+        metrics.set(query_cache=cache_status,
+                    **{f"query_cache_{k}": v for k, v in query_cache.stats().items()})
+
+        if include:
+            # Stock and prices change independently of the catalog: never cached or validated
+            with metrics.phase("hydrate"):
+                results = hydrate(json.loads(body)["results"], include)
+            return _search_response(_search_body(results, None),
+                                    headers={"X-Query-Cache": cache_status, "Cache-Control": "no-store"})
+
+        if etag is None:
+            etag = _etag(body)
+            matched = _etag_matches(event, etag)
+            if matched:
+                return _not_modified(matched)
+
+        return _search_response(body, headers={"X-Query-Cache": cache_status, **_cache_headers(etag)})
 
     except Exception as e:
         return {
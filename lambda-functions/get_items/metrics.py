@@ -0,0 +1,120 @@
+# lambda-functions/get_items/metrics.py
+"""
+Per-invocation phase timings and counters, written as one log line.
+
+    with metrics.phase("fuzzy"):
+        ...
+    metrics.count("pages_read")
+
+lambda_handler resets the module-level `metrics` at the start of every
+invocation and calls emit() at the end. In Lambda the line is CloudWatch
+Embedded Metric Format (timings as <phase>_ms metrics, counters as Count
+metrics, dimension Route); elsewhere, or with METRICS_FORMAT=json, the
+same fields without the "_aws" block.
+
+Phases entered several times (one per Scan page) are summed, including
+across threads, so the phase total of a parallel Scan can exceed its wall
+time. A phase costs about a microsecond.
+
+Work that can outlive its invocation (a prefetched Scan page still in
+flight when the handler returns) runs inside metrics.attached(token), with
+the token taken from metrics.invocation when it was started; whatever it
+records after the next reset() is dropped instead of landing in the next
+invocation's line.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "get_items")
+METRICS_FORMAT = os.environ.get(
+    "METRICS_FORMAT", "emf" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "json").lower()
+
+
+class _Phase:
+    __slots__ = ("metrics", "name", "started")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.started = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add_time(self.name, perf_counter_ns() - self.started)
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.invocation = 0
+        self.reset()
+
+    def reset(self, route="search"):
+        with self._lock:
+            self.invocation += 1
+            self.route = route
+            self.timings_ns = {}
+            self.counters = {}
+            self.properties = {}
+            self._started = perf_counter_ns()
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    @contextmanager
+    def attached(self, invocation):
+        # Records made in this thread count only while `invocation` is current
+        self._local.invocation = invocation
+        try:
+            yield
+        finally:
+            del self._local.invocation
+
+    def _stale(self):
+        return getattr(self._local, "invocation", self.invocation) != self.invocation
+
+    def add_time(self, name, ns):
+        with self._lock:
+            if not self._stale():
+                self.timings_ns[name] = self.timings_ns.get(name, 0) + ns
+
+    def count(self, name, n=1):
+        with self._lock:
+            if not self._stale():
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def set(self, **properties):
+        # Searchable context in the log line, not metrics
+        self.properties.update(properties)
+
+    def record(self):
+        record = {"Route": self.route, **self.properties}
+        timings = {f"{name}_ms": round(ns / 1e6, 3) for name, ns in self.timings_ns.items()}
+        timings["total_ms"] = round((perf_counter_ns() - self._started) / 1e6, 3)
+        record.update(timings)
+        record.update(self.counters)
+        if METRICS_FORMAT == "emf":
+            record["_aws"] = {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace": METRICS_NAMESPACE,
+                    "Dimensions": [["Route"]],
+                    "Metrics": [{"Name": name, "Unit": "Milliseconds"} for name in timings]
+                               + [{"Name": name, "Unit": "Count"} for name in self.counters],
+                }],
+            }
+        return record
+
+    def emit(self):
+        print(json.dumps(self.record(), default=str))
+
+
+# Reset per invocation by lambda_handler
+metrics = Metrics()
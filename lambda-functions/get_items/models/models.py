@@ -1,8 +1,14 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import List, Optional
+
+# Every function imports this file but uses one or two of the models; the
+# others build their validators (and import email_validator) on first use.
+_DEFERRED = ConfigDict(defer_build=True)
 
 
 class UserCreateModel(BaseModel):
+    model_config = _DEFERRED
+
     email: EmailStr
     password: str
     first_name: str
@@ -14,6 +20,8 @@ class UserCreateModel(BaseModel):
 
 
 class UserUpdateModel(BaseModel):
+    model_config = _DEFERRED
+
     user_id: str
     first_name: Optional[str]
     surname: Optional[str]
@@ -25,3 +33,14 @@ class GetItemsQueryModel(BaseModel):
     query: str = Field(..., min_length=1)
     cutoff: int = Field(70, ge=0, le=100)
     limit: int = Field(25, ge=1, le=100)
+    cursor: Optional[str] = None  # next_cursor from a previous partial response
+    include: Optional[str] = Field(None, pattern=r"^(stock|price)(,(stock|price))*$")
+    mode: str = Field("fuzzy", pattern=r"^(fuzzy|prefix)$")  # prefix: typeahead completions
+
+
+class GetItemsBatchModel(BaseModel):
+    model_config = _DEFERRED
+
+    queries: List[str] = Field(..., min_length=1, max_length=100)
+    cutoff: int = Field(70, ge=0, le=100)
+    limit: int = Field(25, ge=1, le=100)
@@ -0,0 +1,224 @@
+# lambda-functions/get_items/ngram_index.py
+"""
+Candidate shortlist for fuzzy search that keeps the exact top results.
+
+On by default (NGRAM_SHORTLIST=false turns it off), for catalogs of at least
+NGRAM_MIN_NAMES names. Instead of scoring every name with token_set_ratio:
+
+1. every name gets an upper bound of its score against the query, computed
+   with numpy from the query tokens it contains, the within-token trigrams
+   it shares with the query (np.bincount over the postings) and its
+   character counts
+2. the NGRAM_PROBE names with the highest bounds are scored; the
+   `limit`-th best score (at least the cutoff) is the bar
+3. the shortlist is every name whose bound reaches the bar, in catalog
+   order, so ranking it gives the same results, ties included, as ranking
+   the whole catalog
+
+token_set_ratio compares the shared tokens ("sect") and the remaining
+query / name tokens ("ab" / "ba", sorted and joined). The sect terms only
+depend on lengths, so they are exact; the ab <-> ba similarity is bounded
+by the longest common subsequence m of the two strings, which is at most:
+
+- the shorter length
+- the shared characters, per character (top NGRAM_ALPHABET - 1 characters,
+  the rest in one bucket) plus the shared spaces
+- (c + 3 * len(ab) + 2 * len(ba) - g) / 5, where g is the number of
+  distinct within-token trigrams of ab and c how many of them the name
+  has: every deleted character destroys at most three trigram occurrences
+  of ab and every inserted one at most two
+
+When too many names reach the bar the full pass is cheaper and shortlist()
+returns None.
+"""
+import os
+from collections import Counter
+from rapidfuzz import process, fuzz
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+NGRAM_SIZE = 3
+NGRAM_SHORTLIST = os.environ.get("NGRAM_SHORTLIST", "true").lower() != "false"
+# Smaller catalogs are scored in full: the bounds cost about as much
+NGRAM_MIN_NAMES = int(os.environ.get("NGRAM_MIN_NAMES", "20000"))
+# Names scored up front to set the bar
+NGRAM_PROBE = int(os.environ.get("NGRAM_PROBE", "200"))
+# Give up (full pass) when more than this share of the names reaches the bar
+NGRAM_MAX_SHARE = float(os.environ.get("NGRAM_MAX_SHARE", "0.5"))
+NGRAM_ALPHABET = 32
+# Queries with more distinct tokens are scored in full
+_MAX_TOKENS = 12
+# Float slack when comparing bounds with rapidfuzz scores
+_EPSILON = 1e-9
+
+
+def ngrams(s, n=NGRAM_SIZE):
+    s = f" {s} "
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+def token_ngrams(tokens, n=NGRAM_SIZE):
+    """
+    Trigrams of each token on its own (" ab", "abc", "bc "), which do not
+    depend on token order.
+    """
+    grams = set()
+    for token in tokens:
+        grams |= ngrams(token, n)
+    return grams
+
+
+def _joined_len(tokens):
+    return sum(map(len, tokens)) + max(len(tokens) - 1, 0)
+
+
+def shortlist_enabled(names):
+    """
+    Whether searches over `names` go through the shortlist (and so need
+    the NgramIndex built).
+    """
+    return NGRAM_SHORTLIST and len(names) >= max(NGRAM_MIN_NAMES, NGRAM_PROBE + 1)
+
+
+def _postings(keys, n, count):
+    """
+    Positions per group from `group * n + position` keys: one uint32 array
+    per group in range(count), positions ascending, duplicates dropped.
+    """
+    keys = np.sort(keys)
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+    bounds = np.cumsum(np.bincount(keys // n, minlength=count))[:-1]
+    return np.split((keys % n).astype(np.uint32), bounds)
+
+
+class NgramIndex:
+    """
+    Per-name token / trigram postings and character counts over a
+    catalog's normalized names.
+    """
+
+    def __init__(self, names):
+        self.names = names
+        n = len(names)
+        counts = Counter("".join(names))
+        counts.pop(" ", None)
+        common = sorted(counts, key=counts.get, reverse=True)[:NGRAM_ALPHABET - 1]
+        self._alphabet = {ch: i for i, ch in enumerate(common)}
+
+        # Per-token work runs once per distinct token; per-name figures are
+        # sums over the (name, token) pairs, in numpy
+        name_tokens = [set(name.split()) for name in names]
+        pair_tokens = [t for tokens in name_tokens for t in tokens]
+        tokens = list(dict.fromkeys(pair_tokens))
+        token_ids = {t: i for i, t in enumerate(tokens)}
+        pair_count = np.fromiter(map(len, name_tokens), np.int64, n)
+        pair_name = np.repeat(np.arange(n, dtype=np.int64), pair_count)
+        pair_token = np.fromiter(map(token_ids.__getitem__, pair_tokens), np.int64, len(pair_tokens))
+
+        token_len = np.fromiter(map(len, tokens), np.int64, len(tokens))
+        token_chars = np.array([self._char_counts([t]) for t in tokens], np.int32).reshape(-1, NGRAM_ALPHABET)
+        chars = np.stack([np.bincount(pair_name, column[pair_token], minlength=n)
+                          for column in token_chars.T.copy()], axis=1)
+        self._token_count = pair_count.astype(np.int32)
+        self._joined_len = (np.bincount(pair_name, token_len[pair_token], minlength=n)
+                            + np.maximum(pair_count - 1, 0)).astype(np.int32)
+        # Counts above 255 of one character would need a wider type
+        self._chars = chars.astype(np.uint8 if chars.max(initial=0) < 256 else np.int32)
+
+        self.token_postings = dict(zip(tokens, _postings(pair_token * n + pair_name, n, len(tokens))))
+
+        # Trigrams of every (name, token) pair; _postings drops the repeats
+        # when several tokens of a name share one
+        gram_ids, token_grams = {}, []
+        for t in tokens:
+            token_grams.append([gram_ids.setdefault(g, len(gram_ids)) for g in ngrams(t)])
+        gram_count = np.fromiter(map(len, token_grams), np.int64, len(tokens))
+        gram_start = np.cumsum(gram_count) - gram_count
+        flat_grams = np.fromiter((g for grams in token_grams for g in grams), np.int64, int(gram_count.sum()))
+        pair_grams = gram_count[pair_token]
+        # Index into flat_grams of each (pair, trigram): the pair's token's
+        # start plus the running offset within the pair
+        offsets = np.repeat(gram_start[pair_token] - (np.cumsum(pair_grams) - pair_grams), pair_grams)
+        grams = flat_grams[offsets + np.arange(len(offsets))]
+        keys = grams * n + np.repeat(pair_name, pair_grams)
+        self.postings = dict(zip(gram_ids, _postings(keys, n, len(gram_ids))))
+
+    def _char_counts(self, tokens):
+        counts = np.zeros(NGRAM_ALPHABET, np.int32)
+        other = NGRAM_ALPHABET - 1
+        for token in tokens:
+            for ch in token:
+                counts[self._alphabet.get(ch, other)] += 1
+        return counts
+
+    def bounds(self, tokens):
+        """
+        Upper bound of token_set_ratio(" ".join(tokens), name) per name.
+        `tokens` are the query's distinct tokens, sorted.
+        """
+        n = len(self.names)
+        grams = [self.postings[g] for g in token_ngrams(tokens) if g in self.postings]
+        shared = np.bincount(np.concatenate(grams), minlength=n) if grams else np.zeros(n, np.int64)
+
+        # Bit j set: the name contains query token j
+        mask = np.zeros(n, np.int32)
+        for j, token in enumerate(tokens):
+            p = self.token_postings.get(token)
+            if p is not None:
+                mask[p] |= 1 << j
+
+        bound = self._bound(tokens, 0, slice(None), shared)
+        for m in np.unique(mask[mask != 0]):
+            idx = np.flatnonzero(mask == m)
+            bound[idx] = self._bound(tokens, int(m), idx, shared[idx])
+        return bound
+
+    def _bound(self, tokens, mask, idx, shared):
+        sect = [t for j, t in enumerate(tokens) if mask >> j & 1]
+        rest = [t for j, t in enumerate(tokens) if not mask >> j & 1]
+        if not rest:
+            return np.full(len(shared), 100.0)  # the query is part of the name
+
+        sect_len, ab_len = _joined_len(sect), _joined_len(rest)
+        ba_tokens = self._token_count[idx] - len(sect)
+        ba_len = self._joined_len[idx] - sect_len - (len(sect) > 0)
+
+        rest_grams = token_ngrams(rest)
+        # Shared trigrams that only come from the sect tokens
+        sect_only = len(token_ngrams(sect) - rest_grams)
+        lcs = np.minimum(ab_len, ba_len)
+        lcs = np.minimum(lcs, (shared - sect_only - len(rest_grams) + 3 * ab_len + 2 * ba_len) // 5)
+        name_chars = self._chars[idx].astype(np.int32) - self._char_counts(sect)
+        spaces = np.minimum(len(rest) - 1, np.maximum(ba_tokens - 1, 0))
+        lcs = np.maximum(np.minimum(lcs, np.minimum(name_chars, self._char_counts(rest)).sum(axis=1) + spaces), 0)
+
+        sect_ab = sect_len + (sect_len > 0) + ab_len
+        sect_ba = sect_len + (sect_len > 0) + ba_len
+        bound = 100 * (1 - (ab_len + ba_len - 2 * lcs) / (sect_ab + sect_ba))
+        if sect_len:
+            bound = np.maximum(bound, 100 * (1 - (1 + ab_len) / (sect_len + sect_ab)))
+            bound = np.maximum(bound, 100 * (1 - (1 + ba_len) / (sect_len + sect_ba)))
+            bound[ba_tokens == 0] = 100.0  # the name is part of the query
+        return bound
+
+    def shortlist(self, term_norm, cutoff, limit):
+        """
+        Names that can still reach the top `limit` token_set_ratio scores
+        (at least `cutoff`), in catalog order, or None when a full scoring
+        pass is needed instead.
+        """
+        tokens = sorted(set(term_norm.split()))
+        if not shortlist_enabled(self.names) or not 0 < len(tokens) <= _MAX_TOKENS:
+            return None
+
+        bound = self.bounds(tokens)
+        probe = np.argpartition(-bound, NGRAM_PROBE)[:NGRAM_PROBE]
+        top = process.extract(term_norm, [self.names[i] for i in probe],
+                              scorer=fuzz.token_set_ratio, score_cutoff=cutoff, limit=limit)
+        bar = max(cutoff or 0, top[-1][1]) if len(top) == limit else (cutoff or 0)
+
+        keep = np.flatnonzero(bound >= bar - _EPSILON)
+        if len(keep) > len(self.names) * NGRAM_MAX_SHARE:
+            return None
+        return [self.names[i] for i in keep]
@@ -0,0 +1,35 @@
+# lambda-functions/get_items/normalize.py
+"""
+Name normalization shared by get_items and ingestion.
+
+Ingestion stores normalize_name(NAZWA_TOWARU) as NAZWA_TOWARU_NORM, so the
+search path only reads precomputed keys. Keep this module stdlib-only so the
+upload notebook and tools can import it.
+"""
+import unicodedata
+
+# Letters NFKD leaves intact (no combining mark to strip)
+_FOLD = str.maketrans({"ł": "l", "Ł": "L"})
+
+
+def normalize_name(s: str) -> str:
+    """
+    Lower-case, accent-free, single-spaced form of a product name.
+    """
+    if not s:
+        return ""
+    s = s.translate(_FOLD)
+    if not s.isascii():
+        s = "".join(ch for ch in unicodedata.normalize("NFKD", s)
+                    if not unicodedata.combining(ch))
+    return " ".join(s.lower().split())
+
+
+def code_key(code) -> str:
+    """
+    Lookup form of a barcode (KOD_KRESKOWY, stored as a number) or SYMBOL:
+    upper-cased, without surrounding space and, when all digits, without
+    leading zeros.
+    """
+    s = str(code).strip().upper() if code is not None else ""
+    return str(int(s)) if s.isascii() and s.isdecimal() else s
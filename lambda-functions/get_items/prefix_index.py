@@ -0,0 +1,86 @@
+# lambda-functions/get_items/prefix_index.py
+"""
+Sorted token index for typeahead (`mode=prefix`).
+
+Every word of every normalized name is stored once per name in a sorted
+array, next to the position of its name. A query word then maps to one
+contiguous slice found by binary search: the last (still being typed) word
+matches as a prefix, earlier words must match whole.
+"""
+import os
+from array import array
+from bisect import bisect_left
+
+# Stop scanning a token slice after this many rejected entries
+PREFIX_SCAN_LIMIT = int(os.environ.get("PREFIX_SCAN_LIMIT", "5000"))
+
+
+class PrefixIndex:
+    """
+    (token, name position) pairs sorted by token, over a catalog's
+    normalized names.
+    """
+
+    def __init__(self, names):
+        # Catalog.names keeps scan order; the whole-term lookup needs them sorted
+        self.names = sorted(names)
+        tokens, positions = [], []
+        for pos, name in enumerate(self.names):
+            name_tokens = set(name.split())
+            tokens.extend(name_tokens)
+            positions.extend([pos] * len(name_tokens))
+        # Stable sort: names sharing a token stay in name order
+        order = sorted(range(len(tokens)), key=tokens.__getitem__)
+        self.tokens = [tokens[i] for i in order]
+        self.positions = array("I", (positions[i] for i in order))
+
+    def _range(self, word, prefix):
+        lo = bisect_left(self.tokens, word)
+        if not prefix:
+            return lo, bisect_left(self.tokens, word + "\x00")
+        return lo, bisect_left(self.tokens, word + "\uffff")
+
+    def complete(self, term_norm, limit):
+        """
+        Up to `limit` names containing every word of `term_norm` (the last
+        one as a prefix). Names starting with the whole term come first,
+        the rest follow in token order, i.e. shortest completion first.
+        """
+        words = term_norm.split()
+        if not words or not self.names:
+            return []
+
+        # Whole-term prefix hits are a slice of the sorted names
+        ranked = []
+        i = bisect_left(self.names, term_norm)
+        while i < len(self.names) and len(ranked) < limit and self.names[i].startswith(term_norm):
+            ranked.append(self.names[i])
+            i += 1
+        if len(ranked) >= limit:
+            return ranked
+
+        # Walk the narrowest word's slice and check the other words per name
+        last = len(words) - 1
+        ranges = [self._range(w, prefix=(k == last)) for k, w in enumerate(words)]
+        driver = min(range(len(words)), key=lambda k: ranges[k][1] - ranges[k][0])
+        lo, hi = ranges[driver]
+        others = [(w, k == last) for k, w in enumerate(words) if k != driver]
+
+        seen = set(ranked)
+        rejected = 0
+        for j in range(lo, hi):
+            name = self.names[self.positions[j]]
+            if name in seen:
+                continue
+            name_tokens = name.split()
+            if all(any(t.startswith(w) if is_prefix else t == w for t in name_tokens)
+                   for w, is_prefix in others):
+                seen.add(name)
+                ranked.append(name)
+                if len(ranked) >= limit:
+                    break
+            else:
+                rejected += 1
+                if rejected >= PREFIX_SCAN_LIMIT:
+                    break
+        return ranked
@@ -0,0 +1,72 @@
+# lambda-functions/get_items/query_cache.py
+import os
+from collections import OrderedDict
+
+QUERY_CACHE_SIZE = int(os.environ.get("QUERY_CACHE_SIZE", "1000"))
+QUERY_CACHE_MAX_BYTES = int(os.environ.get("QUERY_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+
+class QueryCache:
+    """
+    LRU of encoded response bodies keyed by (mode, term_norm, cutoff, limit),
+    bounded by entry count and total body size. Entries belong to one
+    catalog snapshot and are dropped as soon as a different catalog
+    (new version or reload) is passed in.
+    """
+
+    def __init__(self, max_entries=QUERY_CACHE_SIZE, max_bytes=QUERY_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._catalog = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _check_catalog(self, catalog):
+        if catalog is not self._catalog:
+            self._entries.clear()
+            self.bytes = 0
+            self._catalog = catalog
+
+    def get(self, catalog, key):
+        self._check_catalog(catalog)
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, catalog, key, body):
+        self._check_catalog(catalog)
+        size = len(body)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old)
+        self._entries[key] = body
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Current size, and hits / misses / evictions since the container
+        started (entries dropped for a new catalog are not evictions).
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
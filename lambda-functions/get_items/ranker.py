@@ -0,0 +1,52 @@
+# lambda-functions/get_items/ranker.py
+"""
+Two-stage ranking for catalog search.
+
+Stage 1 narrows the candidates to RANK_STAGE1_SIZE names with a cheap
+scorer; stage 2 orders that shortlist with token_set_ratio. Candidate lists
+no longer than RANK_STAGE1_SIZE go straight to stage 2.
+
+RANK_STAGE1_SCORER:
+    qratio  fuzz.QRatio over the candidates
+    ratio   fuzz.ratio over the candidates
+    none    single stage, token_set_ratio on every candidate
+
+tools/bench_ranker.py measures recall and latency for these settings.
+"""
+import os
+from rapidfuzz import process, fuzz
+
+RANK_STAGE1_SCORER = os.environ.get("RANK_STAGE1_SCORER", "none").lower()
+RANK_STAGE1_SIZE = int(os.environ.get("RANK_STAGE1_SIZE", "500"))
+
+_STAGE1_SCORERS = {"qratio": fuzz.QRatio, "ratio": fuzz.ratio}
+
+
+def stage1(term_norm, choices, scorer=None, size=None):
+    """
+    Shortlist of at most `size` choices.
+    """
+    scorer = scorer or RANK_STAGE1_SCORER
+    size = RANK_STAGE1_SIZE if size is None else size
+    if scorer == "none" or size <= 0 or len(choices) <= size:
+        return choices
+    if scorer not in _STAGE1_SCORERS:
+        raise ValueError(f"Unknown RANK_STAGE1_SCORER {scorer!r}")
+    return [name for name, _, _ in process.extract(
+        term_norm, choices, scorer=_STAGE1_SCORERS[scorer], limit=size)]
+
+
+def rank(term_norm, choices, cutoff, limit, scorer=None, size=None):
+    """
+    Returns (name, score, index) matches like process.extract, best first.
+    """
+    choices = stage1(term_norm, choices, scorer, size)
+    if not choices:
+        return []
+    return process.extract(
+        term_norm,
+        choices,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=cutoff,
+        limit=limit,
+    )
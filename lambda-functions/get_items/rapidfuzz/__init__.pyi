@@ -1,10 +0,0 @@
-from __future__ import annotations
-
-__author__: str
-__license__: str
-__version__: str
-
-from rapidfuzz import distance as distance
-from rapidfuzz import fuzz as fuzz
-from rapidfuzz import process as process
-from rapidfuzz import utils as utils
@@ -1,65 +0,0 @@
-# SPDX-License-Identifier: MIT
-# Copyright (C) 2022 Max Bachmann
-"""
-The Levenshtein (edit) distance is a string metric to measure the
-difference between two strings/sequences s1 and s2.
-It's defined as the minimum number of insertions, deletions or
-substitutions required to transform s1 into s2.
-"""
-
-from __future__ import annotations
-
-from typing import Callable, Hashable, Sequence
-
-from rapidfuzz.distance import Editops, Opcodes
-
-def distance(
-    s1: Sequence[Hashable],
-    s2: Sequence[Hashable],
-    *,
-    weights: tuple[int, int, int] | None = (1, 1, 1),
-    processor: Callable[..., Sequence[Hashable]] | None = None,
-    score_cutoff: int | None = None,
-    score_hint: int | None = None,
-) -> int: ...
-def normalized_distance(
-    s1: Sequence[Hashable],
-    s2: Sequence[Hashable],
-    *,
-    weights: tuple[int, int, int] | None = (1, 1, 1),
-    processor: Callable[..., Sequence[Hashable]] | None = None,
-    score_cutoff: float | None = 0,
-    score_hint: float | None = 0,
-) -> float: ...
-def similarity(
-    s1: Sequence[Hashable],
-    s2: Sequence[Hashable],
-    *,
-    weights: tuple[int, int, int] | None = (1, 1, 1),
-    processor: Callable[..., Sequence[Hashable]] | None = None,
-    score_cutoff: int | None = None,
-    score_hint: int | None = None,
-) -> int: ...
-def normalized_similarity(
-    s1: Sequence[Hashable],
-    s2: Sequence[Hashable],
-    *,
-    weights: tuple[int, int, int] | None = (1, 1, 1),
-    processor: Callable[..., Sequence[Hashable]] | None = None,
-    score_cutoff: float | None = 0,
-    score_hint: float | None = 0,
-) -> float: ...
-def editops(
-    s1: Sequence[Hashable],
-    s2: Sequence[Hashable],
-    *,
-    processor: Callable[..., Sequence[Hashable]] | None = None,
-    score_hint: int | None = None,
-) -> Editops: ...
-def opcodes(
-    s1: Sequence[Hashable],
-    s2: Sequence[Hashable],
-    *,
-    processor: Callable[..., Sequence[Hashable]] | None = None,
-    score_hint: int | None = None,
-) -> Opcodes: ...
@@ -1,37 +0,0 @@
-# SPDX-License-Identifier: MIT
-# Copyright (C) 2022 Max Bachmann
-
-from __future__ import annotations
-
-from . import (
-    OSA,
-    DamerauLevenshtein,
-    Hamming,
-    Indel,
-    Jaro,
-    JaroWinkler,
-    LCSseq,
-    Levenshtein,
-    Postfix,
-    Prefix,
-)
-from ._initialize import Editop, Editops, MatchingBlock, Opcode, Opcodes, ScoreAlignment
-
-__all__ = [
-    "Editop",
-    "Editops",
-    "Opcode",
-    "Opcodes",
-    "ScoreAlignment",
-    "MatchingBlock",
-    "DamerauLevenshtein",
-    "Hamming",
-    "Indel",
-    "Jaro",
-    "JaroWinkler",
-    "LCSseq",
-    "Levenshtein",
-    "OSA",
-    "Prefix",
-    "Postfix",
-]
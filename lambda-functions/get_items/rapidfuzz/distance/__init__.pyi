@@ -1,21 +0,0 @@
-# SPDX-License-Identifier: MIT
-# Copyright (C) 2022 Max Bachmann
-
-from __future__ import annotations
-
-from . import OSA as OSA
-from . import DamerauLevenshtein as DamerauLevenshtein
-from . import Hamming as Hamming
-from . import Indel as Indel
-from . import Jaro as Jaro
-from . import JaroWinkler as JaroWinkler
-from . import LCSseq as LCSseq
-from . import Levenshtein as Levenshtein
-from . import Postfix as Postfix
-from . import Prefix as Prefix
-from ._initialize import Editop as Editop
-from ._initialize import Editops as Editops
-from ._initialize import MatchingBlock as MatchingBlock
-from ._initialize import Opcode as Opcode
-from ._initialize import Opcodes as Opcodes
-from ._initialize import ScoreAlignment as ScoreAlignment
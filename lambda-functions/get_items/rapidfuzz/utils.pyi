@@ -1,8 +0,0 @@
-# SPDX-License-Identifier: MIT
-# Copyright (C) 2022 Max Bachmann
-
-from __future__ import annotations
-
-from typing import Hashable, Sequence
-
-def default_process(sentence: Sequence[Hashable]) -> Sequence[Hashable]: ...
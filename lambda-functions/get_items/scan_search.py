@@ -0,0 +1,235 @@
+# lambda-functions/get_items/scan_search.py
+"""
+Per-request Scan search with resumable cursors.
+
+Used when the catalog cache is disabled (CATALOG_CACHE=false) or a client
+sends back a `cursor`. Each call reads pages while the next one is expected
+to finish within its time budget (SCAN_TARGET_MS, shortened by the Lambda
+deadline), merges the matches into the top-k carried by the cursor and
+returns a new cursor positioned after the last page it scored.
+
+Scanning is pipelined: the next page is fetched on a background thread
+while the current one is scored, and only one page plus the top-k heap is
+held in memory at a time. A page still in flight at the deadline is billed
+either way, so the call waits up to half of SCAN_RESERVE_MS more for it
+and scores it; only a page slower than that is dropped (and re-read by the
+next call from the cursor).
+"""
+import base64
+import hashlib
+import heapq
+import hmac
+import json
+import os
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from datetime import datetime
+from rapidfuzz import process, fuzz
+from catalog import parse_iso, scan_page
+from metrics import metrics
+from normalize import normalize_name
+
+# Latency target of one scan call, and the part of the Lambda's remaining
+# time kept back for ranking, hydration and the response
+SCAN_TARGET_MS = int(os.environ.get("SCAN_TARGET_MS", "2000"))
+SCAN_RESERVE_MS = int(os.environ.get("SCAN_RESERVE_MS", "300"))
+
+# Optional hard caps per call on top of the time budget (0 = none)
+MAX_SCAN_PAGES = int(os.environ.get("SCAN_PAGE_LIMIT", "0"))
+MAX_SCAN_ITEMS = int(os.environ.get("SCAN_ITEM_LIMIT", "0"))
+
+# Cursors are HMAC-signed so clients cannot forge scan positions or results.
+# Without a configured secret they only resume on the same warm container.
+_CURSOR_KEY = os.environ.get("CURSOR_SECRET", "").encode("utf-8") or os.urandom(32)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _unb64(s: str) -> bytes:
+    return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
+
+
+def encode_cursor(state: dict) -> str:
+    payload = zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+    sig = hmac.new(_CURSOR_KEY, payload, hashlib.sha256).digest()[:16]
+    return f"{_b64(payload)}.{_b64(sig)}"
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        payload_b64, sig_b64 = cursor.split(".")
+        payload, sig = _unb64(payload_b64), _unb64(sig_b64)
+    except Exception:
+        raise InvalidCursor("Malformed cursor.")
+    expected = hmac.new(_CURSOR_KEY, payload, hashlib.sha256).digest()[:16]
+    if not hmac.compare_digest(sig, expected):
+        raise InvalidCursor("Cursor signature mismatch.")
+    return json.loads(zlib.decompress(payload))
+
+
+def _score_page(term_norm, items, cutoff):
+    """
+    Score one page; returns [score, ID_TOWARU, NAZWA_TOWARU, DATA_UTWORZENIA]
+    entries for every item above the cutoff.
+    """
+    name_to_items = {}
+    for it in items:
+        name_norm = it.get("NAZWA_TOWARU_NORM") or normalize_name(it.get("NAZWA_TOWARU"))
+        if name_norm and it.get("ID_TOWARU"):
+            name_to_items.setdefault(name_norm, []).append(it)
+
+    matches = process.extract(
+        term_norm,
+        list(name_to_items.keys()),
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=cutoff,
+        limit=None,
+    ) if name_to_items else []
+
+    return [
+        [score, int(it["ID_TOWARU"]), it.get("NAZWA_TOWARU"), it.get("DATA_UTWORZENIA", "")]
+        for name, score, _ in matches
+        for it in name_to_items[name]
+    ]
+
+
+def _dt(date):
+    return parse_iso(date) or datetime.min
+
+
+class TopK:
+    """
+    Bounded top-k of [score, ID_TOWARU, NAZWA_TOWARU, DATA_UTWORZENIA]
+    entries, one per ID_TOWARU (latest DATA_UTWORZENIA wins).
+    """
+
+    def __init__(self, limit, entries=()):
+        self.limit = limit
+        self._by_id = {}
+        # (score, seq, ID_TOWARU, entry) min-heap; replaced rows are skipped lazily
+        self._heap = []
+        self._seq = 0
+        for e in entries:
+            self.push(e)
+
+    def _heappush(self, e):
+        self._seq += 1
+        heapq.heappush(self._heap, (e[0], self._seq, e[1], e))
+
+    def _drop_stale(self):
+        while self._heap and self._by_id.get(self._heap[0][2]) is not self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+    def push(self, e):
+        cur = self._by_id.get(e[1])
+        if cur is not None:
+            if _dt(cur[3]) < _dt(e[3]):
+                self._by_id[e[1]] = e
+                self._heappush(e)
+            return
+
+        if len(self._by_id) >= self.limit:
+            self._drop_stale()
+            if e[0] <= self._heap[0][0]:
+                return
+            _, _, evicted, _ = heapq.heappop(self._heap)
+            del self._by_id[evicted]
+
+        self._by_id[e[1]] = e
+        self._heappush(e)
+
+    def entries(self):
+        return sorted(self._by_id.values(), key=lambda e: -e[0])
+
+
+def scan_deadline(context=None):
+    """
+    time.monotonic() deadline for one scan call: SCAN_TARGET_MS from now,
+    or earlier when the invocation itself ends sooner.
+    """
+    budget_ms = SCAN_TARGET_MS
+    remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if remaining is not None:
+        budget_ms = min(budget_ms, remaining() - SCAN_RESERVE_MS)
+    return time.monotonic() + max(budget_ms, 0) / 1000
+
+
+def _within_caps(pages, scanned):
+    return ((not MAX_SCAN_PAGES or pages < MAX_SCAN_PAGES)
+            and (not MAX_SCAN_ITEMS or scanned < MAX_SCAN_ITEMS))
+
+
+def scan_search(term_norm, cutoff, limit, cursor=None, deadline=None):
+    """
+    Returns (results, next_cursor); next_cursor is None once the whole
+    table has been searched. Scanning stops at `deadline` (see
+    scan_deadline) with the pages scored so far.
+    """
+    deadline = scan_deadline() if deadline is None else deadline
+    top, start_key = TopK(limit), None
+    if cursor:
+        state = decode_cursor(cursor)
+        if [state["q"], state["c"], state["l"]] != [term_norm, cutoff, limit]:
+            raise InvalidCursor("Cursor belongs to a different query.")
+        top = TopK(limit, state["top"])
+        start_key = state["lek"]
+
+    invocation = metrics.invocation
+
+    def fetch(key):
+        # A page that outlives this invocation must not count in the next one
+        with metrics.attached(invocation):
+            return scan_page(**({"ExclusiveStartKey": key} if key else {}))
+
+    # Position after the last scored page; done once the table is exhausted
+    lek, done = start_key, False
+    pages, scanned = 0, 0
+    prefetch = ThreadPoolExecutor(max_workers=1)
+    try:
+        started = time.monotonic()
+        pending = prefetch.submit(fetch, lek)
+        while True:
+            late = False
+            try:
+                # A throttled page must not outlive the budget
+                items, page_lek = pending.result(timeout=max(deadline - time.monotonic(), 0))
+            except FuturesTimeout:
+                try:
+                    items, page_lek = pending.result(timeout=SCAN_RESERVE_MS / 2000)
+                except FuturesTimeout:
+                    break
+                late = True
+            pages += 1
+            scanned += len(items)
+
+            # Next page is in flight while this one is scored, if it should finish in time
+            now = time.monotonic()
+            page_seconds = (now - started) / pages  # pipelined fetch + score
+            more = (not late and bool(page_lek) and _within_caps(pages, scanned)
+                    and now + page_seconds <= deadline)
+            if more:
+                pending = prefetch.submit(fetch, page_lek)
+
+            with metrics.phase("fuzzy"):
+                for e in _score_page(term_norm, items, cutoff):
+                    top.push(e)
+            lek, done = page_lek, not page_lek
+
+            if not more:
+                break
+    finally:
+        prefetch.shutdown(wait=False, cancel_futures=True)
+
+    entries = top.entries()
+    results = [{"ID_TOWARU": e[1], "NAZWA_TOWARU": e[2]} for e in entries]
+    next_cursor = None if done else encode_cursor({
+        "q": term_norm, "c": cutoff, "l": limit, "lek": lek, "top": entries,
+    })
+    return results, next_cursor
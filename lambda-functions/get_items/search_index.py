@@ -0,0 +1,146 @@
+# lambda-functions/get_items/search_index.py
+"""
+Prebuilt search index for get_items.
+
+The file holds the deduplicated catalog (latest DATA_UTWORZENIA per
+ID_TOWARU) sorted by normalized name, so a container can mmap it at cold
+start instead of scanning `towary`. Only the normalized names are decoded
+into Python strings (rapidfuzz needs them); IDs, display names and dates
+stay in the mapping and are read for matched names only.
+
+Layout (little-endian, sections padded to 8 bytes):
+    header       magic, name_count, record_count, version_len,
+                 names_len, strings_len
+    version      utf-8
+    name_first   u32[name_count + 1]   records of name i are
+                                       [name_first[i], name_first[i + 1])
+    ids          i64[record_count]
+    str_offsets  u32[4 * record_count + 1]  NAZWA_TOWARU, DATA_UTWORZENIA,
+                                            KOD_KRESKOWY, SYMBOL of record r
+                                            are strings 4r .. 4r+3
+    names        "\\n"-joined normalized names, sorted
+    strings      utf-8 blob addressed by str_offsets
+"""
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from functools import cached_property
+from ngram_index import NgramIndex
+from normalize import code_key
+from prefix_index import PrefixIndex
+
+MAGIC = b"OSIDX002"
+_HEADER = struct.Struct("<8sIIIII")
+
+_FIELDS = ("NAZWA_TOWARU", "DATA_UTWORZENIA", "KOD_KRESKOWY", "SYMBOL")
+
+
+def _pad(n):
+    return (8 - n % 8) % 8
+
+
+def write_index(path, catalog):
+    """
+    Write `catalog` (anything with `names`, `items_for` and `version`)
+    to `path` in the index format above.
+    """
+    names = sorted(catalog.names)
+    name_first = array("I", [0])
+    ids = array("q")
+    str_offsets = array("I", [0])
+    strings = bytearray()
+
+    for name in names:
+        for it in sorted(catalog.items_for(name), key=lambda v: int(v["ID_TOWARU"])):
+            ids.append(int(it["ID_TOWARU"]))
+            for field in _FIELDS:
+                value = it.get(field)
+                strings += ("" if value is None else str(value)).encode("utf-8")
+                str_offsets.append(len(strings))
+        name_first.append(len(ids))
+
+    version = (catalog.version or "").encode("utf-8")
+    names_blob = "\n".join(n.replace("\n", " ") for n in names).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(names), len(ids), len(version),
+                             len(names_blob), len(strings)))
+        for section in (version, name_first.tobytes(), ids.tobytes(),
+                        str_offsets.tobytes(), names_blob, bytes(strings)):
+            f.write(section)
+            f.write(b"\0" * _pad(len(section)))
+
+
+class MappedCatalog:
+    """
+    Read-only catalog backed by an mmap of an index file. Shares the
+    interface of `catalog.Catalog` (`names`, `items_for`, `version`).
+    """
+
+    source = "index"
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+
+        magic, name_count, record_count, version_len, names_len, strings_len = \
+            _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a {MAGIC.decode()} search index file")
+
+        pos = _HEADER.size
+
+        def section(length, fmt=None):
+            nonlocal pos
+            sec = view[pos:pos + length]
+            pos += length + _pad(length)
+            return sec.cast(fmt) if fmt else sec
+
+        self.version = bytes(section(version_len)).decode("utf-8") or None
+        self._name_first = section(4 * (name_count + 1), "I")
+        self._ids = section(8 * record_count, "q")
+        self._str_offsets = section(4 * (len(_FIELDS) * record_count + 1), "I")
+        names_blob = section(names_len)
+        self._strings = section(strings_len)
+
+        self.names = str(names_blob, "utf-8").split("\n") if name_count else []
+        self.item_count = record_count
+
+    @cached_property
+    def ngrams(self):
+        return NgramIndex(self.names)
+
+    @cached_property
+    def prefix(self):
+        return PrefixIndex(self.names)
+
+    @cached_property
+    def codes(self):
+        # code_key(KOD_KRESKOWY / SYMBOL) -> record numbers
+        codes = {}
+        for r in range(self.item_count):
+            for f in (2, 3):
+                key = code_key(self._string(len(_FIELDS) * r + f))
+                if key:
+                    codes.setdefault(key, []).append(r)
+        return codes
+
+    def _string(self, i):
+        return str(self._strings[self._str_offsets[i]:self._str_offsets[i + 1]], "utf-8")
+
+    def _record(self, r):
+        item = {"ID_TOWARU": self._ids[r]}
+        for f, field in enumerate(_FIELDS):
+            item[field] = self._string(len(_FIELDS) * r + f)
+        return item
+
+    def items_for(self, name_norm):
+        i = bisect_left(self.names, name_norm)
+        if i == len(self.names) or self.names[i] != name_norm:
+            return []
+        return [self._record(r) for r in range(self._name_first[i], self._name_first[i + 1])]
+
+    def items_for_code(self, code):
+        return [self._record(r) for r in self.codes.get(code_key(code), [])]
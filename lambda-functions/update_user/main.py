@@ -4,11 +4,13 @@ import os
 import time
 import boto3
 from models.models import UserUpdateModel  # Pydantic
+from lazy import Lazy
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(os.environ["USERS_TABLE"])
 
-cognito = boto3.client("cognito-idp")
+# Created on first use, only attribute changes call Cognito
+cognito = Lazy(lambda: boto3.client("cognito-idp"))
 USER_POOL_ID = os.environ.get("USER_POOL_ID")
 
 
@@ -7,6 +7,57 @@ import zipfile
 
 layer_dir = Path(__file__).parent / "python"
 zip_path = Path(__file__).parent.parent / "lambda_layers.zip"
+functions_dir = Path(__file__).parent.parent / "lambda-functions"
+
+# `--check` only verifies that no function folder shadows the layer
+CHECK_ONLY = "--check" in sys.argv[1:]
+
+
+def find_shadowing_problems():
+    """
+    Function folders come before /opt/python on sys.path, so a package
+    vendored next to main.py hides the layer's copy. A copy without the
+    layer's compiled modules silently falls back to pure Python (rapidfuzz
+    scoring gets orders of magnitude slower).
+    """
+    problems = []
+    layer_pkgs = [p for p in layer_dir.iterdir() if (p / "__init__.py").exists()]
+    for fn_dir in sorted(p for p in functions_dir.iterdir() if p.is_dir()):
+        for layer_pkg in layer_pkgs:
+            fn_pkg = fn_dir / layer_pkg.name
+            if not fn_pkg.is_dir():
+                continue
+            layer_native = {p.relative_to(layer_pkg) for p in layer_pkg.rglob("*.so")}
+            fn_native = {p.relative_to(fn_pkg) for p in fn_pkg.rglob("*.so")}
+            missing = sorted(str(p) for p in layer_native - fn_native)
+            if missing:
+                problems.append(
+                    f"{fn_dir.name}/{layer_pkg.name} shadows the layer's native build "
+                    f"(missing {', '.join(missing[:3])}{', ...' if len(missing) > 3 else ''})"
+                )
+
+        # Several versions of one distribution side by side
+        dists = {}
+        for d in fn_dir.glob("*.dist-info"):
+            dists.setdefault(d.name.split("-")[0].lower(), []).append(d.name)
+        for project, names in sorted(dists.items()):
+            if len(names) > 1:
+                problems.append(f"{fn_dir.name} ships conflicting {project} dist-infos: {', '.join(sorted(names))}")
+    return problems
+
+
+def check_shadowing():
+    problems = find_shadowing_problems()
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems:
+        sys.exit("Remove the vendored packages from the function folders; they come from the layer.")
+    print("✅ No function folder shadows the layer")
+
+
+if CHECK_ONLY:
+    check_shadowing()
+    sys.exit(0)
 
 # Clean old __pycache__ and *.dist-info
 for item in layer_dir.glob("**/__pycache__"):
@@ -19,6 +70,9 @@ req_file = layer_dir / "requirements.txt"
 subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
 subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(req_file), "-t", str(layer_dir)])
 
+# Fail before zipping if a function would hide the freshly built native modules
+check_shadowing()
+
 # Zip the layer
 if zip_path.exists():
     zip_path.unlink()
@@ -28,8 +28,8 @@ module "api_http" {
   cors = {
     allow_origins     = ["*"]
     allow_methods     = ["GET","POST","PUT","OPTIONS"]
-    allow_headers     = ["Authorization","Content-Type"]
-    expose_headers    = []
+    allow_headers     = ["Authorization","Content-Type","If-None-Match"]
+    expose_headers    = ["ETag"]
     max_age           = 3600
     allow_credentials = false
   }
@@ -52,6 +52,15 @@ module "api_http" {
       lambda_name = module.lambdas["get_items"].lambda_name
     }
 
+    towary_batch = {
+      method      = "POST"
+      path        = "/towary"          # public, batch of queries in the body
+      auth_type   = "NONE"
+      scopes      = []
+      lambda_arn  = module.lambdas["get_items"].lambda_arn
+      lambda_name = module.lambdas["get_items"].lambda_name
+    }
+
     towary_secure = {
       method      = "GET"
       path        = "/towary-auth"     # protected
@@ -10,10 +10,20 @@ module "towary_table" {
     { name = "DATA_MODYFIKACJI", type = "S" },
     { name = "NAZWA_TOWARU", type = "S" },
     { name = "NAZWA_VAT", type = "S" },
-    { name = "DATA_UTWORZENIA", type = "S" }
+    { name = "DATA_UTWORZENIA", type = "S" },
+    { name = "ID_TOWARU_AKT", type = "N" }
   ]
 
   global_secondary_indexes = [
+    {
+      # Sparse: only the latest revision of each product carries
+      # ID_TOWARU_AKT (maintained by ingestion); get_items scans this
+      # instead of the whole history. Projects what its search reads.
+      name               = "aktualne_index"
+      hash_key           = "ID_TOWARU_AKT"
+      projection_type    = "INCLUDE"
+      non_key_attributes = "NAZWA_TOWARU,NAZWA_TOWARU_NORM,DATA_UTWORZENIA,KOD_KRESKOWY,SYMBOL"
+    },
     {
       name            = "nazwa_towaru_index"
       hash_key        = "NAZWA_TOWARU"
@@ -9,9 +9,22 @@ locals {
       environment = {
         TABLE_NAME   = module.towary_table.table_name   # <-- was USERS_TABLE
         USER_POOL_ID = module.auth.user_pool_id
+        CATALOG_TTL_SECONDS = "300"
+        SCAN_SEGMENTS = "4"
+        SCAN_TARGET_MS = "2000"  # per-call budget of cursor searches, capped by the invocation deadline
+        CURSOR_SECRET = random_password.cursor_secret.result
+        STOCK_TABLE_NAME = module.akt_stan_mag_table.table_name
+        PRICE_TABLE_NAME = module.ceny_towarow_table.table_name
+        CATALOG_INDEX = var.get_items_catalog_index
+        NGRAM_SHORTLIST = "true"  # exact fuzzy shortlist, used from NGRAM_MIN_NAMES (20000) names up
       }
       attach_dynamodb_policy = true
       dynamodb_table_arn     = module.towary_table.table_arn
+      # include=stock,price reads these
+      dynamodb_extra_table_arns = [
+        module.akt_stan_mag_table.table_arn,
+        module.ceny_towarow_table.table_arn,
+      ]
       layers = [
         #"arn:aws:lambda:eu-central-1:389251923599:layer:common_deps:1"
         aws_lambda_layer_version.common_deps.arn
@@ -90,7 +103,7 @@ locals {
 }
 
 ############################################################
-# Copy common Pydantic models to each Lambda function
+# Copy common Pydantic models (and lazy.py) to each Lambda function
 ############################################################
 resource "null_resource" "copy_common_models" {
   for_each = local.lambdas
@@ -99,10 +112,12 @@ resource "null_resource" "copy_common_models" {
     command = <<PY
 python - <<END
 import shutil, os
-src = os.path.join("${path.module}", "..", "lambda-functions", "common", "models.py")
-dst_dir = os.path.join("${path.module}", "..", "lambda-functions", "${each.key}", "models")
+common = os.path.join("${path.module}", "..", "lambda-functions", "common")
+fn_dir = os.path.join("${path.module}", "..", "lambda-functions", "${each.key}")
+dst_dir = os.path.join(fn_dir, "models")
 os.makedirs(dst_dir, exist_ok=True)
-shutil.copy(src, os.path.join(dst_dir, "models.py"))
+shutil.copy(os.path.join(common, "models.py"), os.path.join(dst_dir, "models.py"))
+shutil.copy(os.path.join(common, "lazy.py"), os.path.join(fn_dir, "lazy.py"))
 END
 PY
   }
@@ -110,9 +125,16 @@ PY
   triggers = {
     lambda_name   = each.key
     models_sha256 = filemd5("${path.module}/../lambda-functions/common/models.py")
+    lazy_sha256   = filemd5("${path.module}/../lambda-functions/common/lazy.py")
   }
 }
 
+# Signs get_items search cursors (must be shared by all containers)
+resource "random_password" "cursor_secret" {
+  length  = 48
+  special = false
+}
+
 resource "aws_lambda_layer_version" "common_deps" {
   filename            = "../lambda_layers/layer.zip" # this must exist already
   layer_name          = "common_deps"
@@ -150,6 +172,7 @@ module "lambdas" {
   environment             = each.value.environment
   attach_dynamodb_policy  = each.value.attach_dynamodb_policy
   dynamodb_table_arn      = each.value.dynamodb_table_arn
+  dynamodb_extra_table_arns = lookup(each.value, "dynamodb_extra_table_arns", [])
   layers                  = each.value.layers
   vpc_subnet_ids          = each.value.vpc_subnet_ids
   vpc_security_group_ids  = each.value.vpc_security_group_ids
@@ -158,3 +181,25 @@ module "lambdas" {
   region       = var.aws_region
   user_pool_id = module.auth.user_pool_id
 }
+
+# Keeps get_items containers' catalog loaded so user requests skip the Scan
+resource "aws_cloudwatch_event_rule" "get_items_warmup" {
+  name                = "get-items-warmup-${var.environment}"
+  description         = "Preload the get_items search catalog"
+  schedule_expression = var.get_items_warmup_schedule
+  tags                = local.tags
+}
+
+resource "aws_cloudwatch_event_target" "get_items_warmup" {
+  rule  = aws_cloudwatch_event_rule.get_items_warmup.name
+  arn   = module.lambdas["get_items"].lambda_arn
+  input = jsonencode({ warmup = true })
+}
+
+resource "aws_lambda_permission" "allow_eventbridge_get_items_warmup" {
+  statement_id  = "AllowInvokeFromEventBridgeWarmup"
+  action        = "lambda:InvokeFunction"
+  function_name = module.lambdas["get_items"].lambda_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.get_items_warmup.arn
+}
@@ -20,6 +20,8 @@ resource "aws_dynamodb_table" "this" {
         projection_type = global_secondary_index.value.projection_type
 
         range_key = contains(keys(global_secondary_index.value), "range_key") ? global_secondary_index.value.range_key : null
+        # Comma-separated, for projection_type = "INCLUDE"
+        non_key_attributes = contains(keys(global_secondary_index.value), "non_key_attributes") ? split(",", global_secondary_index.value.non_key_attributes) : null
       }
   }
 }
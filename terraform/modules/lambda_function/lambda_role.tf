@@ -32,10 +32,10 @@ resource "aws_iam_role_policy" "lambda_dynamodb" {
     Statement = [{
       Effect   = "Allow"
       Action   = var.dynamodb_actions
-      Resource = [
-        var.dynamodb_table_arn,
-        "${var.dynamodb_table_arn}/index/*"
-      ]
+      Resource = concat(
+        [var.dynamodb_table_arn, "${var.dynamodb_table_arn}/index/*"],
+        flatten([for arn in var.dynamodb_extra_table_arns : [arn, "${arn}/index/*"]])
+      )
     }]
   })
 }
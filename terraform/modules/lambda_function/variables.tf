@@ -153,10 +153,16 @@ variable "dynamodb_table_arn" {
   default     = ""
 }
 
+variable "dynamodb_extra_table_arns" {
+  description = "Further DynamoDB table ARNs the same policy grants access to"
+  type        = list(string)
+  default     = []
+}
+
 variable "dynamodb_actions" {
   description = "List of DynamoDB actions"
   type        = list(string)
-  default     = ["dynamodb:GetItem","dynamodb:PutItem","dynamodb:UpdateItem","dynamodb:Query","dynamodb:Scan"]
+  default     = ["dynamodb:GetItem","dynamodb:BatchGetItem","dynamodb:PutItem","dynamodb:UpdateItem","dynamodb:Query","dynamodb:Scan"]
 }
 
 variable "layers" {
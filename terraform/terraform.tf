@@ -2,5 +2,6 @@ terraform {
   required_providers {
     aws     = { source = "hashicorp/aws", version = "~> 6.8" }
     archive = { source = "hashicorp/archive" }
+    random  = { source = "hashicorp/random" }
   }
 }
\ No newline at end of file
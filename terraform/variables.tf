@@ -37,4 +37,16 @@ variable "google_client_secret" {
   type      = string
   default   = null
   sensitive = true
+}
+
+variable "get_items_warmup_schedule" {
+  type        = string
+  description = "EventBridge schedule of the get_items catalog warm-up"
+  default     = "rate(5 minutes)"
+}
+
+variable "get_items_catalog_index" {
+  type        = string
+  description = "towary GSI get_items searches (latest revisions only); \"\" scans the whole table. Set to \"aktualne_index\" once the ingestion notebook has backfilled ID_TOWARU_AKT"
+  default     = ""
 }
\ No newline at end of file
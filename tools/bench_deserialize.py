@@ -0,0 +1,105 @@
+"""
+Per-item cost of turning Scan items into Python values, and back into JSON.
+
+    python tools/bench_deserialize.py
+    python tools/bench_deserialize.py --items 200000 --repeat 7
+
+Compares boto3's TypeDeserializer (Decimal numbers, converted back by
+main._json_default on output) with catalog.deserialize_item (int/str) on
+items shaped like a catalog Scan page: the get_items projection in the
+low-level wire format, with names from --data. Reports the best of
+--repeat runs in nanoseconds per item.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+get_items_dir = root_dir / "lambda-functions" / "get_items"
+
+
+def _names(data_dir):
+    towary = data_dir / "TOWARY.csv"
+    path, column = (towary, "NAZWA_TOWARU") if towary.exists() \
+        else (data_dir / "KLASY_TOWAROW.csv", "NAZWA_KLASY")
+    if not path.exists():
+        return ["Wkręt do drewna 4x40 ocynk", "Farba akrylowa biała 5 l", "Klej montażowy 300 ml"]
+    with open(path, newline="", encoding="utf-8") as f:
+        names = [(row.get(column) or "").strip() for row in csv.DictReader(f)]
+    return [n for n in names if n]
+
+
+def wire_items(count, names):
+    from normalize import normalize_name
+
+    items = []
+    for i in range(1, count + 1):
+        name = names[i % len(names)]
+        items.append({
+            "ID_TOWARU": {"N": str(i)},
+            "NAZWA_TOWARU": {"S": name},
+            "NAZWA_TOWARU_NORM": {"S": normalize_name(name)},
+            "DATA_UTWORZENIA": {"S": f"2024-01-{1 + i % 28:02d}T00:00:00"},
+            "KOD_KRESKOWY": {"N": str(5900000000000 + i)},
+            "SYMBOL": {"S": f"T-{i:07d}"},
+        })
+    return items
+
+
+def _best_ns_per_item(fn, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        fn(items)
+        best = min(best, time.perf_counter_ns() - started)
+    return best / len(items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--data", default=str(root_dir / "data" / "inwent_tables_csv"))
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("TABLE_NAME", "towary")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+    sys.path.insert(0, str(get_items_dir))
+    from boto3.dynamodb.types import TypeDeserializer
+    from catalog import deserialize_item
+    from main import _json_default
+
+    items = wire_items(args.items, _names(Path(args.data)))
+    deserializer = TypeDeserializer()
+
+    def boto3_items(wire):
+        return [{k: deserializer.deserialize(v) for k, v in it.items()} for it in wire]
+
+    def fast_items(wire):
+        return [deserialize_item(it) for it in wire]
+
+    assert json.dumps(boto3_items(items[:1000]), default=_json_default) \
+        == json.dumps(fast_items(items[:1000]), default=_json_default)
+
+    boto3_out, fast_out = boto3_items(items), fast_items(items)
+    rows = [
+        ("deserialize", _best_ns_per_item(boto3_items, items, args.repeat),
+         _best_ns_per_item(fast_items, items, args.repeat)),
+        ("json.dumps", _best_ns_per_item(lambda v: json.dumps(v, default=_json_default), boto3_out, args.repeat),
+         _best_ns_per_item(lambda v: json.dumps(v, default=_json_default), fast_out, args.repeat)),
+    ]
+    rows.append(("total", sum(r[1] for r in rows), sum(r[2] for r in rows)))
+
+    print(f"{args.items:,} items, best of {args.repeat}, ns/item")
+    print(f"{'step':<12} {'boto3':>9} {'int/str':>9} {'speedup':>8}")
+    for step, slow, fast in rows:
+        print(f"{step:<12} {slow:>9.0f} {fast:>9.0f} {slow / fast:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
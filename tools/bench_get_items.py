@@ -0,0 +1,303 @@
+"""
+Benchmark get_items end to end against an in-process DynamoDB fake.
+
+    python tools/bench_get_items.py --sizes 10000,100000
+    python tools/bench_get_items.py --sizes 10000,100000,1000000 --save-baseline bench.json
+    python tools/bench_get_items.py --sizes 10000,100000 --baseline bench.json
+
+Each catalog size runs in its own process. The process fills the fake
+`towary`, `akt_stan_mag` and `ceny_towarow` tables from --data, calls
+lambda_handler once to load the catalog (reported as cold_ms), then sends
+--queries requests. The query mix covers fuzzy queries with typos,
+typeahead prefixes, barcode/ID lookups, repeated popular queries and
+include=stock,price.
+
+Names come from TOWARY.csv (NAZWA_TOWARU) when --data has one, otherwise
+from KLASY_TOWAROW.csv names; either way they are scaled up with size and
+pack variants to the requested item count. Environment variables of the
+function (SEARCH_ENGINE, RANK_STAGE1_SCORER, ...) pass through. The fake
+tables take about 5 KB per catalog item (a 1M-item run needs ~6 GB of RAM).
+
+--revisions N stores every product N times with older DATA_MODYFIKACJI, as
+repeated ingestion leaves it; only the newest row carries ID_TOWARU_AKT.
+With CATALOG_INDEX=aktualne_index the fake also has that sparse index, so
+
+    python tools/bench_get_items.py --revisions 5
+    CATALOG_INDEX=aktualne_index python tools/bench_get_items.py --revisions 5
+
+compare scanning the whole history with scanning the latest revisions.
+
+Reported per size: p50/p95/p99 latency (ms), queries/s, peak RSS (MB, with
+the RSS of the filled fake tables shown separately) and DynamoDB read units
+per query. --baseline compares with a saved run and
+exits with status 1 when a p95 or RCU figure regresses by more than
+--tolerance.
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import resource
+import string
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+get_items_dir = root_dir / "lambda-functions" / "get_items"
+
+MIX = {"fuzzy": 50, "prefix": 20, "exact": 15, "repeat": 10, "include": 5}
+_VARIANTS = ["0,5 l", "1 l", "5 kg", "10 szt", "25 kg", "3x20 mm", "6x40 mm", "8x60 mm",
+          "M6", "M8", "M10", "100 mm", "200 mm", "biały", "szary", "czarny"]
+
+
+def _base_names(data_dir):
+    towary = data_dir / "TOWARY.csv"
+    path, column = (towary, "NAZWA_TOWARU") if towary.exists() \
+        else (data_dir / "KLASY_TOWAROW.csv", "NAZWA_KLASY")
+    with open(path, newline="", encoding="utf-8") as f:
+        names = {(row.get(column) or "").strip() for row in csv.DictReader(f)}
+    names.discard("")
+    return sorted(names)
+
+
+def _catalog_items(base, size, rng):
+    items = []
+    for i in range(1, size + 1):
+        name = base[(i - 1) % len(base)]
+        if i > len(base):
+            name = f"{name} {rng.choice(_VARIANTS)} {rng.choice(_VARIANTS)}"
+        items.append({
+            "ID_TOWARU": i,
+            "ID_TOWARU_AKT": i,
+            "DATA_MODYFIKACJI": "2024-01-01T00:00:00",
+            "NAZWA_TOWARU": name,
+            "DATA_UTWORZENIA": f"2024-01-{1 + i % 28:02d}T00:00:00",
+            "KOD_KRESKOWY": 5900000000000 + i,
+            "SYMBOL": f"T-{i:07d}",
+            # Stand-in for the ~100 other towary columns (billed, not projected)
+            "OPIS": "x" * 400,
+        })
+    return items
+
+
+def _history(items, revisions):
+    # Older revisions of every item, without the ID_TOWARU_AKT flag
+    for n in range(1, revisions):
+        for it in items:
+            old = dict(it, DATA_MODYFIKACJI=f"{2024 - n}-01-01T00:00:00")
+            del old["ID_TOWARU_AKT"]
+            yield old
+
+
+def _load_fake(size, data_dir, seed, revisions=1):
+    from fake_dynamodb import FakeClient, FakeTable
+    from normalize import normalize_name
+
+    rng = random.Random(seed)
+    items = _catalog_items(_base_names(data_dir), size, rng)
+    for it in items:
+        it["NAZWA_TOWARU_NORM"] = normalize_name(it["NAZWA_TOWARU"])
+
+    client = FakeClient()
+    client.add_table("towary", "ID_TOWARU", "DATA_MODYFIKACJI", items + list(_history(items, revisions)) + [
+        {"ID_TOWARU": 0, "DATA_MODYFIKACJI": "CATALOG_VERSION", "VERSION": f"bench-{size}"},
+    ], shared_attributes=("DATA_MODYFIKACJI", "DATA_UTWORZENIA", "OPIS"))
+    if os.environ.get("CATALOG_INDEX"):
+        # Same key and projection as terraform/dynamodb.tf
+        client.add_index("towary", os.environ["CATALOG_INDEX"], "ID_TOWARU_AKT", projection=(
+            "NAZWA_TOWARU", "NAZWA_TOWARU_NORM", "DATA_UTWORZENIA", "KOD_KRESKOWY", "SYMBOL"))
+    # Like AKT_STAN_MAG.csv: some products are stocked outside M1S, some nowhere
+    client.add_table("akt_stan_mag", "ID_TOWARU", "ID_MAGAZYNU", [
+        {"ID_TOWARU": it["ID_TOWARU"], "ID_MAGAZYNU": warehouse,
+         "ILOSC": rng.randint(0, 500), "ILOSC_ZAREZERWOWANA": 0}
+        for it in items
+        for warehouse in rng.sample(("M1S", "M1P", "M8", "MDEP"), rng.choice((0, 1, 1, 1, 2, 3)))
+    ], shared_attributes=("ID_MAGAZYNU", "ILOSC", "ILOSC_ZAREZERWOWANA"))
+    client.add_table("ceny_towarow", "ID_TOWARU", "TS", [
+        {"ID_TOWARU": it["ID_TOWARU"], "TS": f"0x{ts:016X}", "CENA": str(rng.randint(1, 9999) / 100),
+         "UPUST": "0", "CENA_ZAKUPU": "1"}
+        for it in items for ts in (1, 2)
+    ], shared_attributes=("TS", "CENA", "UPUST", "CENA_ZAKUPU"))
+    return client, FakeTable(client, "towary"), items
+
+
+def _queries(items, count, rng):
+    popular = [it["NAZWA_TOWARU"] for it in rng.sample(items, min(20, len(items)))]
+    kinds = list(MIX)
+    weights = [MIX[k] for k in kinds]
+    out = []
+    for kind in rng.choices(kinds, weights, k=count):
+        it = rng.choice(items)
+        name = it["NAZWA_TOWARU"]
+        qs = {}
+        if kind == "fuzzy" or kind == "include":
+            i = rng.randrange(len(name))
+            qs["query"] = name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+            if kind == "include":
+                qs["include"] = "stock,price"
+        elif kind == "prefix":
+            qs["query"] = name[:rng.randint(2, max(2, min(8, len(name))))]
+            qs["mode"] = "prefix"
+        elif kind == "exact":
+            qs["query"] = str(it["KOD_KRESKOWY"] if rng.random() < 0.7 else it["ID_TOWARU"])
+        else:
+            qs["query"] = rng.choice(popular)
+        out.append((kind, qs))
+    return out
+
+
+class _Context:
+    def get_remaining_time_in_millis(self):
+        return 30000
+
+
+def _pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))] if values else 0.0
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def run_size(size, data_dir, queries, seed, revisions=1):
+    """
+    One catalog size in this process; returns the result row.
+    """
+    os.environ.setdefault("TABLE_NAME", "towary")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+    os.environ.setdefault("SEARCH_INDEX_PATH", "")
+    sys.path[:0] = [str(get_items_dir), str(Path(__file__).parent)]
+
+    client, table, items = _load_fake(size, data_dir, seed, revisions)
+    mix = _queries(items, queries, random.Random(seed + 1))
+    del items
+    fake_rss_mb = _peak_rss_mb()
+
+    import catalog
+    catalog.table = table
+    import main
+    context = _Context()
+
+    def call(qs):
+        event = {"requestContext": {"http": {"method": "GET"}}, "queryStringParameters": qs}
+        started = time.perf_counter()
+        resp = main.lambda_handler(event, context)
+        elapsed = (time.perf_counter() - started) * 1000
+        if resp.get("statusCode") != 200:
+            raise RuntimeError(f"{qs}: {resp.get('statusCode')} {resp.get('body')}")
+        return elapsed
+
+    rcu_before = client.consumed_rcu
+    cold_ms = call({"query": "benchmark warm up"})
+    cold_rcu = client.consumed_rcu - rcu_before
+
+    rcu_before = client.consumed_rcu
+    latencies, by_kind = [], {}
+    started = time.perf_counter()
+    for kind, qs in mix:
+        ms = call(qs)
+        latencies.append(ms)
+        by_kind.setdefault(kind, []).append(ms)
+    wall = time.perf_counter() - started
+
+    return {
+        "size": size,
+        "queries": len(mix),
+        "cold_ms": round(cold_ms, 1),
+        "cold_rcu": round(cold_rcu, 1),
+        "p50_ms": round(_pct(latencies, 50), 2),
+        "p95_ms": round(_pct(latencies, 95), 2),
+        "p99_ms": round(_pct(latencies, 99), 2),
+        "qps": round(len(mix) / wall, 1),
+        "rcu_per_query": round((client.consumed_rcu - rcu_before) / len(mix), 3),
+        "peak_rss_mb": _peak_rss_mb(),
+        "fake_rss_mb": fake_rss_mb,
+        "p95_ms_by_kind": {k: round(_pct(v, 95), 2) for k, v in sorted(by_kind.items())},
+    }
+
+
+def _print_table(rows, baseline=None):
+    base = {r["size"]: r for r in (baseline or [])}
+    print(f"{'size':>9} {'cold ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'q/s':>8} {'RCU/q':>7} {'RSS MB':>8} {'fake MB':>8}")
+    for r in rows:
+        line = (f"{r['size']:>9} {r['cold_ms']:>9} {r['p50_ms']:>8} {r['p95_ms']:>8} "
+                f"{r['p99_ms']:>8} {r['qps']:>8} {r['rcu_per_query']:>7} {r['peak_rss_mb']:>8} {r['fake_rss_mb']:>8}")
+        if r["size"] in base:
+            b = base[r["size"]]
+            line += f"   p95 {_delta(r['p95_ms'], b['p95_ms'])}, RCU/q {_delta(r['rcu_per_query'], b['rcu_per_query'])}"
+        print(line)
+        print(f"{'':>9} p95 by kind: " + ", ".join(f"{k} {v}" for k, v in r["p95_ms_by_kind"].items()))
+
+
+def _delta(new, old):
+    return "n/a" if not old else f"{(new - old) / old * 100:+.1f}%"
+
+
+def _regressions(rows, baseline, tolerance):
+    base = {r["size"]: r for r in baseline}
+    found = []
+    for r in rows:
+        b = base.get(r["size"])
+        if not b:
+            continue
+        for key in ("p95_ms", "rcu_per_query"):
+            if b[key] and (r[key] - b[key]) / b[key] > tolerance:
+                found.append(f"size {r['size']}: {key} {b[key]} -> {r[key]}")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000", help="catalog item counts")
+    parser.add_argument("--data", default=str(root_dir / "data" / "inwent_tables_csv"))
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--revisions", type=int, default=1, help="stored revisions per product")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with a JSON file from --save-baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed regression (0.10 = 10%%)")
+    parser.add_argument("--child-size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child_size:
+        print(json.dumps(run_size(args.child_size, Path(args.data), args.queries, args.seed, args.revisions)))
+        return 0
+
+    rows = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        # A fresh interpreter per size keeps RSS and the warm caches separate
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child-size", str(size), "--data", args.data,
+             "--queries", str(args.queries), "--seed", str(args.seed),
+             "--revisions", str(args.revisions)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode:
+            sys.stderr.write(proc.stderr)
+            return proc.returncode
+        # The function logs to stdout too; the result is the last line
+        rows.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    _print_table(rows, baseline)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(rows, indent=2) + "\n")
+        print(f"✅ baseline written to {args.save_baseline}")
+
+    if baseline:
+        regressions = _regressions(rows, baseline, args.tolerance)
+        for line in regressions:
+            print(f"❌ {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
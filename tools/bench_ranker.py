@@ -0,0 +1,136 @@
+"""
+Recall/latency benchmark for the get_items two-stage ranker.
+
+    python tools/bench_ranker.py --csv data/inwent_tables_csv/KLASY_TOWAROW.csv --column NAZWA_KLASY
+    python tools/bench_ranker.py --csv TOWARY.csv --multiply 20 --sizes 200,500,1000
+
+Queries are catalog names with a typo, a dropped word or only their first
+words. For every RANK_STAGE1_SCORER / RANK_STAGE1_SIZE setting the same
+queries go through the ranker over the whole catalog; `shortlist` runs the
+single-stage ranker on the exact trigram shortlist (NGRAM_SHORTLIST, with
+each size used as its NGRAM_PROBE). Recall compares the
+returned token_set_ratio scores rank by rank with the exhaustive single-stage
+top-`limit` over the whole catalog, so equally scored names (size variants)
+count as interchangeable.
+
+`--scorers fts5` runs the SQLite FTS5 engine instead, with each size used as
+its FTS5_CANDIDATES (the database goes to a temporary directory).
+"""
+import argparse
+import csv
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+root_dir = Path(__file__).parent.parent
+get_items_dir = root_dir / "lambda-functions" / "get_items"
+
+
+def _names(path, column, multiply):
+    from normalize import normalize_name
+
+    with open(path, newline="", encoding="utf-8") as f:
+        names = {normalize_name(row.get(column) or "") for row in csv.DictReader(f)}
+    names.discard("")
+    base = sorted(names)
+    # Variants the way real catalogs have them (sizes, pack counts)
+    for k in range(1, multiply):
+        names.update(f"{n} {k * 5} szt" if k % 2 else f"{n} {k}x{k * 10} mm" for n in base)
+    return sorted(names)
+
+
+def _queries(names, count, rng):
+    queries = []
+    for name in rng.sample(names, min(count, len(names))):
+        words = name.split()
+        kind = rng.randrange(3)
+        if kind == 0 and len(name) > 3:
+            i = rng.randrange(len(name))
+            name = name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+        elif kind == 1 and len(words) > 1:
+            words.pop(rng.randrange(len(words)))
+            name = " ".join(words)
+        else:
+            name = " ".join(words[:max(1, len(words) // 2)])
+        queries.append(name)
+    return queries
+
+
+def _pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--csv", default=str(root_dir / "data" / "inwent_tables_csv" / "KLASY_TOWAROW.csv"))
+    parser.add_argument("--column", default="NAZWA_KLASY")
+    parser.add_argument("--multiply", type=int, default=1, help="add size variants per name")
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--cutoff", type=int, default=70)
+    parser.add_argument("--limit", type=int, default=25)
+    parser.add_argument("--scorers", default="none,shortlist,qratio,ratio")
+    parser.add_argument("--sizes", default="100,300,500,1000")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(get_items_dir))
+    from rapidfuzz import process, fuzz
+    import ngram_index
+    from ngram_index import NgramIndex
+    from ranker import rank
+    from engines import Fts5Engine
+
+    names = _names(args.csv, args.column, args.multiply)
+    queries = _queries(names, args.queries, random.Random(args.seed))
+    index = NgramIndex(names)
+    catalog = SimpleNamespace(names=names, ngrams=index)
+
+    truth = [
+        [score for _, score, _ in process.extract(q, names, scorer=fuzz.token_set_ratio,
+                                                  score_cutoff=args.cutoff, limit=args.limit)]
+        for q in queries
+    ]
+
+    print(f"{len(names)} names, {len(queries)} queries, cutoff {args.cutoff}, limit {args.limit}")
+    print(f"{'scorer':<8} {'size':>6} {'recall':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for scorer in args.scorers.split(","):
+        for size in ([0] if scorer == "none" else map(int, args.sizes.split(","))):
+            if scorer == "fts5":
+                tmpdir = tempfile.TemporaryDirectory()
+                engine = Fts5Engine(path=f"{tmpdir.name}/fts.sqlite", candidates=size)
+                engine.build(catalog)
+
+                def search(q):
+                    return [score for _, score in engine.search(q, args.cutoff, args.limit)]
+            elif scorer == "shortlist":
+                ngram_index.NGRAM_PROBE = size
+
+                def search(q):
+                    shortlist = index.shortlist(q, args.cutoff, args.limit)
+                    choices = names if shortlist is None else shortlist
+                    return [score for _, score, _ in rank(q, choices, args.cutoff, args.limit, scorer="none")]
+            else:
+                def search(q):
+                    return [score for _, score, _ in rank(q, names, args.cutoff, args.limit,
+                                                          scorer=scorer, size=size)]
+
+            found, expected, times = 0, 0, []
+            for q, want in zip(queries, truth):
+                started = time.perf_counter()
+                got = search(q)
+                times.append((time.perf_counter() - started) * 1000)
+                found += sum(g >= w for g, w in zip(got, want))
+                expected += len(want)
+            recall = found / expected if expected else 1.0
+            print(f"{scorer:<8} {size or '-':>6} {recall:>7.3f} {statistics.median(times):>8.2f} "
+                  f"{_pct(times, 95):>8.2f} {_pct(times, 99):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
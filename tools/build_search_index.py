@@ -0,0 +1,90 @@
+"""
+Build the get_items search index file.
+
+    python tools/build_search_index.py --table towary -o lambda-functions/get_items/search_index.bin
+    python tools/build_search_index.py --csv data/inwent_tables_csv/TOWARY.csv --version-from towary -o search_index.bin
+
+Point the function at the file with SEARCH_INDEX_PATH. The index carries the
+catalog version (--version, or the table's CATALOG_VERSION item); get_items
+only loads it while the table's version matches and falls back to a Scan
+once the version moves past it.
+
+A CSV export carries no version, so pass --version or --version-from with the
+table the export was taken from. Without either, the index is stamped with a
+content digest, which never matches a CATALOG_VERSION: such a file only works
+against tables that carry no version item.
+"""
+import argparse
+import csv
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+get_items_dir = Path(__file__).parent.parent / "lambda-functions" / "get_items"
+
+
+def _csv_items(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            id_towaru = (row.get("ID_TOWARU") or "").strip()
+            if not id_towaru.isdigit():
+                continue
+            yield {
+                "ID_TOWARU": int(id_towaru),
+                "NAZWA_TOWARU": row.get("NAZWA_TOWARU") or "",
+                "NAZWA_TOWARU_NORM": row.get("NAZWA_TOWARU_NORM") or "",
+                "DATA_UTWORZENIA": row.get("DATA_UTWORZENIA") or "",
+                "KOD_KRESKOWY": row.get("KOD_KRESKOWY") or "",
+                "SYMBOL": row.get("SYMBOL") or "",
+            }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--table", help="DynamoDB table to scan (e.g. towary)")
+    source.add_argument("--csv", help="TOWARY-style CSV export")
+    parser.add_argument("-o", "--output", required=True)
+    versions = parser.add_mutually_exclusive_group()
+    versions.add_argument("--version", help="catalog version to embed")
+    versions.add_argument("--version-from", metavar="TABLE",
+                          help="embed TABLE's CATALOG_VERSION (for --csv exports of that table)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+    os.environ["TABLE_NAME"] = args.table or args.version_from or "towary"
+    sys.path.insert(0, str(get_items_dir))
+    import catalog
+    from search_index import MappedCatalog, write_index
+
+    started = time.perf_counter()
+    if args.table:
+        version = args.version or catalog.read_catalog_version()
+        cat = catalog.scan_catalog(version)
+    else:
+        version = args.version or (catalog.read_catalog_version() if args.version_from else None)
+        if args.version_from and version is None:
+            print(f"⚠️ {args.version_from} has no CATALOG_VERSION item, using a content digest")
+        cat = catalog.Catalog.from_items(_csv_items(args.csv), version=version)
+
+    write_index(args.output, cat)
+
+    if cat.version is None:
+        # Stamp CSV builds with a content digest so rebuilt files are comparable;
+        # get_items only accepts it from a table without a CATALOG_VERSION item
+        cat.version = "sha256:" + hashlib.sha256(Path(args.output).read_bytes()).hexdigest()[:16]
+        write_index(args.output, cat)
+
+    loaded = time.perf_counter()
+    index = MappedCatalog(args.output)
+    load_ms = (time.perf_counter() - loaded) * 1000
+
+    print(f"✅ {args.output}: {len(index.names)} names, {index.item_count} items, "
+          f"version {index.version}, {Path(args.output).stat().st_size} bytes "
+          f"(built in {loaded - started:.2f}s, loads in {load_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
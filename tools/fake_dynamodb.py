@@ -0,0 +1,219 @@
+"""
+In-process stand-in for the DynamoDB calls get_items makes.
+
+Covers what catalog.py, scan_search.py and hydrate.py use: the low-level
+client's scan (with Segment/TotalSegments, ExclusiveStartKey, 1 MB pages),
+query on the hash key, get_item and batch_get_item, plus the Table
+resource's name / get_item / meta.client. scan and query also take an
+IndexName added with add_index (a sparse GSI with an INCLUDE projection).
+Items are stored in the low-level wire format ({"N": "1"}), so the
+function's own deserialization runs.
+
+Read capacity is counted the way DynamoDB bills eventually consistent
+reads: Scan/Query pages by the size of the items read, rounded up to 4 KB;
+GetItem/BatchGetItem per item, rounded up to 4 KB; each unit costs 0.5 RCU.
+"""
+import math
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+PAGE_BYTES = 1024 * 1024
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _to_wire(item, shared=None):
+    # `shared` reuses one wire value per distinct repeated value across a load
+    wire = {}
+    for k, v in item.items():
+        if v is None or v == "":
+            continue
+        value = shared.get((k, v)) if shared is not None else None
+        if value is None:
+            value = _serializer.serialize(Decimal(str(v)) if isinstance(v, (int, float)) else v)
+        wire[k] = value
+    return wire
+
+
+def _size(item):
+    # Attribute names plus values; numbers take about one byte per two digits
+    size = 0
+    for name, value in item.items():
+        (kind, raw), = value.items()
+        size += len(name) + (len(raw) // 2 + 1 if kind == "N" else len(str(raw).encode("utf-8")))
+    return size
+
+
+def _rcu(size):
+    return max(1, math.ceil(size / 4096)) * 0.5
+
+
+def _project(item, projection):
+    if not projection:
+        return dict(item)
+    keep = [p.strip() for p in projection.split(",")]
+    return {k: item[k] for k in keep if k in item}
+
+
+class FakeTableData:
+    def __init__(self, name, hash_key, range_key):
+        self.name = name
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.items = []     # sorted by (hash, range)
+        self._by_key = {}   # (hash, range) -> position
+        self._by_hash = {}  # hash -> positions, range order
+
+    def _key(self, item):
+        return (item[self.hash_key][next(iter(item[self.hash_key]))],
+                item[self.range_key][next(iter(item[self.range_key]))])
+
+    def load(self, items, shared_attributes=()):
+        shared = {}
+        wire = []
+        for it in items:
+            w = _to_wire(it, shared)
+            for k in shared_attributes:
+                if k in w:
+                    shared.setdefault((k, it[k]), w[k])
+            wire.append(w)
+        self.load_wire(wire)
+
+    def load_wire(self, wire):
+        num_hash = "N" in wire[0][self.hash_key] if wire else False
+        wire.sort(key=lambda it: (Decimal(self._key(it)[0]) if num_hash else self._key(it)[0],
+                                  self._key(it)[1]))
+        self.items = wire
+        self._by_key = {self._key(it): pos for pos, it in enumerate(wire)}
+        self._by_hash = {}
+        for pos, it in enumerate(wire):
+            self._by_hash.setdefault(self._key(it)[0], []).append(pos)
+
+
+class FakeClient:
+    """
+    The subset of the boto3 DynamoDB client used by get_items.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.indexes = {}   # (table name, index name) -> FakeTableData
+        self._lock = threading.Lock()
+        self.consumed_rcu = 0.0
+        self.calls = {}
+
+    def add_table(self, name, hash_key, range_key, items, shared_attributes=()):
+        """
+        `shared_attributes` name low-cardinality attributes whose wire
+        values are stored once, which keeps million-item tables in memory.
+        """
+        table = FakeTableData(name, hash_key, range_key)
+        table.load(items, shared_attributes)
+        self.tables[name] = table
+        return table
+
+    def add_index(self, table_name, index_name, hash_key, projection=()):
+        """
+        Sparse GSI on `hash_key`: only items that have it, with the table
+        keys, the index key and the `projection` attributes.
+        """
+        base = self.tables[table_name]
+        keep = {base.hash_key, base.range_key, hash_key, *projection}
+        index = FakeTableData(index_name, hash_key, base.range_key)
+        index.load_wire([{k: v for k, v in it.items() if k in keep}
+                         for it in base.items if hash_key in it])
+        self.indexes[(table_name, index_name)] = index
+        return index
+
+    def _data(self, table_name, index_name=None):
+        return self.indexes[(table_name, index_name)] if index_name else self.tables[table_name]
+
+    def _count(self, op, rcu):
+        with self._lock:
+            self.consumed_rcu += rcu
+            self.calls[op] = self.calls.get(op, 0) + 1
+
+    def scan(self, TableName, ProjectionExpression=None, ExclusiveStartKey=None,
+             Segment=0, TotalSegments=1, Limit=None, IndexName=None, **_):
+        table = self._data(TableName, IndexName)
+        pos = self._next(table, ExclusiveStartKey, Segment, TotalSegments)
+        out, read, last = [], 0, None
+        while pos < len(table.items):
+            item = table.items[pos]
+            read += _size(item)
+            out.append(_project(item, ProjectionExpression))
+            last = item
+            pos += TotalSegments
+            if read >= PAGE_BYTES or (Limit and len(out) >= Limit):
+                break
+        self._count("scan", _rcu(read))
+        resp = {"Items": out, "Count": len(out), "ScannedCount": len(out)}
+        if pos < len(table.items) and last is not None:
+            resp["LastEvaluatedKey"] = {table.hash_key: last[table.hash_key],
+                                        table.range_key: last[table.range_key]}
+        return resp
+
+    @staticmethod
+    def _next(table, start_key, segment, total):
+        if not start_key:
+            return segment
+        return table._by_key[table._key(start_key)] + total
+
+    def query(self, TableName, KeyConditionExpression, ExpressionAttributeValues,
+              ProjectionExpression=None, ScanIndexForward=True, Limit=None, IndexName=None, **_):
+        table = self._data(TableName, IndexName)
+        # Only "<hash key> = :placeholder" is supported
+        placeholder = KeyConditionExpression.split("=")[1].strip()
+        (_, value), = ExpressionAttributeValues[placeholder].items()
+        positions = table._by_hash.get(value, [])
+        if not ScanIndexForward:
+            positions = positions[::-1]
+        if Limit:
+            positions = positions[:Limit]
+        items = [table.items[p] for p in positions]
+        self._count("query", _rcu(sum(_size(it) for it in items)))
+        return {"Items": [_project(it, ProjectionExpression) for it in items], "Count": len(items)}
+
+    def get_item(self, TableName, Key, ProjectionExpression=None, **_):
+        table = self.tables[TableName]
+        pos = table._by_key.get(table._key(Key))
+        if pos is None:
+            self._count("get_item", 0.5)
+            return {}
+        item = table.items[pos]
+        self._count("get_item", _rcu(_size(item)))
+        return {"Item": _project(item, ProjectionExpression)}
+
+    def batch_get_item(self, RequestItems, **_):
+        responses = {}
+        for name, request in RequestItems.items():
+            table = self.tables[name]
+            rows = []
+            for key in request["Keys"]:
+                pos = table._by_key.get(table._key(key))
+                if pos is not None:
+                    self._count("batch_get_item", _rcu(_size(table.items[pos])))
+                    rows.append(_project(table.items[pos], request.get("ProjectionExpression")))
+            responses[name] = rows
+        return {"Responses": responses, "UnprocessedKeys": {}}
+
+
+class FakeTable:
+    """
+    Enough of boto3's Table resource for catalog.table.
+    """
+
+    def __init__(self, client, name):
+        self.name = name
+        self.meta = SimpleNamespace(client=client)
+        self._client = client
+
+    def get_item(self, Key, ProjectionExpression=None, **_):
+        wire_key = _to_wire(Key)
+        resp = self._client.get_item(TableName=self.name, Key=wire_key,
+                                     ProjectionExpression=ProjectionExpression)
+        if "Item" in resp:
+            resp["Item"] = {k: _deserializer.deserialize(v) for k, v in resp["Item"].items()}
+        return resp
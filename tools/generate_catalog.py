@@ -0,0 +1,226 @@
+"""
+Generate a scaled synthetic inventory dataset from the real CSV exports.
+
+    python tools/generate_catalog.py --scale 10 -o /tmp/inwent_x10
+    python tools/generate_catalog.py --products 1000000 -o /tmp/inwent_1m --seed 7
+
+Writes TOWARY.csv, CENY_TOWAROW.csv, AKT_STAN_MAG.csv and KLASY_TOWAROW.csv
+with the source files' columns (TOWARY gets the columns the pipeline uses
+when the source has no TOWARY.csv). What is learned from --source:
+
+- ID_TOWARU zero-padding width (widened when the scaled IDs need it) and
+  the hex TS rowversion format; new TS values continue after the largest
+  one seen, in file order
+- name tokens: frequencies and per-name token counts, from NAZWA_TOWARU
+  when there is a TOWARY.csv, otherwise from NAZWA_KLASY
+- the class tree (TYP N rows, copied as is) and, per product, its class
+  assignments (TYP T rows), price rows per price group and stock rows per
+  warehouse; every generated product resamples those of a random source
+  product, so the files stay consistent with each other
+
+Rows are written product by product, so memory use does not grow with the
+output size.
+"""
+import argparse
+import bisect
+import csv
+import itertools
+import random
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+
+TOWARY_COLUMNS = ["ID_TOWARU", "NAZWA_TOWARU", "SYMBOL", "KOD_KRESKOWY", "SYMBOL_JED",
+                  "NAZWA_VAT", "ID_TYP_TOWAR", "WAGA", "CZY_BLOKADA",
+                  "DATA_UTWORZENIA", "DATA_MODYFIKACJI"]
+_VARIANTS = ["0,5 l", "1 l", "5 l", "1 kg", "5 kg", "25 kg", "10 szt", "50 szt", "100 szt",
+             "3x20", "4x40", "6x60", "8x80", "M6", "M8", "M10", "biały", "szary", "czarny"]
+_UNITS = ["szt", "szt", "szt", "kg", "m", "opak", "l", "m2"]
+_DATE_FROM = datetime(2015, 1, 1)
+_DATE_SPAN_DAYS = 365 * 10
+
+
+def _read(path):
+    if not path.exists():
+        return [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def _group_by_product(rows):
+    by_id = {}
+    for row in rows:
+        if row.get("ID_TOWARU"):
+            by_id.setdefault(row["ID_TOWARU"], []).append(row)
+    return by_id
+
+
+class _Sampler:
+    """
+    Weighted sampling from a Counter by bisecting cumulative weights.
+    """
+
+    def __init__(self, counts):
+        self.values = list(counts)
+        self.cumulative = list(itertools.accumulate(counts[v] for v in self.values))
+
+    def __call__(self, rng):
+        return self.values[bisect.bisect(self.cumulative, rng.random() * self.cumulative[-1])]
+
+
+class _Hex:
+    """
+    Monotonic 0x%016X rowversion counter, continuing after `start`.
+    """
+
+    def __init__(self, start):
+        self.value = start
+
+    def __call__(self, rng):
+        self.value += rng.randint(1, 3)
+        return f"0x{self.value:016X}"
+
+
+def _ean13(body12):
+    digits = [int(d) for d in body12]
+    check = (10 - sum(d * (3 if i % 2 else 1) for i, d in enumerate(digits)) % 10) % 10
+    return f"{body12}{check}"
+
+
+class Model:
+    """
+    What the generator learns from the source export.
+    """
+
+    def __init__(self, source):
+        self.towary_fields, towary = _read(source / "TOWARY.csv")
+        self.ceny_fields, ceny = _read(source / "CENY_TOWAROW.csv")
+        self.stan_fields, stan = _read(source / "AKT_STAN_MAG.csv")
+        self.klasy_fields, klasy = _read(source / "KLASY_TOWAROW.csv")
+        if not ceny or not klasy:
+            raise SystemExit(f"❌ {source} needs at least CENY_TOWAROW.csv and KLASY_TOWAROW.csv")
+        self.towary_fields = self.towary_fields or TOWARY_COLUMNS
+
+        ids = [r["ID_TOWARU"] for r in itertools.chain(towary, ceny, stan, klasy) if r.get("ID_TOWARU")]
+        self.id_width = max(len(i) for i in ids)
+        self.source_products = sorted(set(ids), key=int)
+
+        self.ceny = _group_by_product(ceny)
+        self.stan = _group_by_product(stan)
+        self.assignments = _group_by_product(r for r in klasy if r["TYP"] == "T")
+        self.class_rows = [r for r in klasy if r["TYP"] != "T"]
+        self.class_names = {r["ID_KLASY"]: r["NAZWA_KLASY"] for r in self.class_rows}
+        self.next_klasa = max(int(r["ID_KLASY"]) for r in klasy) + 1
+
+        ts = [int(r["TS"], 16) for r in itertools.chain(ceny, klasy)
+              if (r.get("TS") or "").startswith("0x")]
+        self.max_ts = max(ts, default=0)
+
+        names = [r.get("NAZWA_TOWARU") for r in towary] if towary \
+            else [r["NAZWA_KLASY"] for r in self.class_rows]
+        tokens = Counter()
+        lengths = Counter()
+        for name in filter(None, names):
+            words = name.split()
+            tokens.update(words)
+            lengths[len(words)] += 1
+        self.token = _Sampler(tokens)
+        self.length = _Sampler(lengths)
+
+    def name(self, rng, class_name):
+        words = class_name.split() if class_name else []
+        extra = max(1, self.length(rng) - len(words) // 2)
+        words = words[:2] + [self.token(rng) for _ in range(extra)]
+        if rng.random() < 0.6:
+            words.append(rng.choice(_VARIANTS))
+        return " ".join(words)
+
+
+def generate(model, out_dir, products, rng):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    width = max(model.id_width, len(str(products)))
+    ts = _Hex(model.max_ts)
+    klasa_ids = itertools.count(model.next_klasa)
+    counts = Counter()
+
+    files = {name: open(out_dir / name, "w", newline="", encoding="utf-8")
+             for name in ("TOWARY.csv", "CENY_TOWAROW.csv", "AKT_STAN_MAG.csv", "KLASY_TOWAROW.csv")}
+    try:
+        towary = csv.DictWriter(files["TOWARY.csv"], model.towary_fields, extrasaction="ignore")
+        ceny = csv.DictWriter(files["CENY_TOWAROW.csv"], model.ceny_fields)
+        stan = csv.DictWriter(files["AKT_STAN_MAG.csv"], model.stan_fields)
+        klasy = csv.DictWriter(files["KLASY_TOWAROW.csv"], model.klasy_fields)
+        for w in (towary, ceny, stan, klasy):
+            w.writeheader()
+
+        # The class tree is shared by every product
+        for row in model.class_rows:
+            klasy.writerow(row)
+            counts["KLASY_TOWAROW.csv"] += 1
+
+        for n in range(1, products + 1):
+            id_towaru = str(n).zfill(width)
+            template = rng.choice(model.source_products)
+
+            assigned = model.assignments.get(template, [])
+            for row in assigned:
+                klasy.writerow({**row, "ID_KLASY": next(klasa_ids), "ID_TOWARU": id_towaru, "TS": ts(rng)})
+            counts["KLASY_TOWAROW.csv"] += len(assigned)
+
+            for row in model.ceny.get(template, []):
+                ceny.writerow({**row, "ID_TOWARU": id_towaru, "TS": ts(rng)})
+                counts["CENY_TOWAROW.csv"] += 1
+
+            for row in model.stan.get(template, []):
+                stan.writerow({**row, "ID_TOWARU": id_towaru})
+                counts["AKT_STAN_MAG.csv"] += 1
+
+            class_name = model.class_names.get(assigned[0]["ID_KLASY_NADRZ"], "") if assigned else ""
+            created = _DATE_FROM + timedelta(days=rng.randrange(_DATE_SPAN_DAYS), seconds=rng.randrange(86400))
+            modified = created + timedelta(days=rng.randrange(365), seconds=rng.randrange(86400))
+            towary.writerow({
+                "ID_TOWARU": id_towaru,
+                "NAZWA_TOWARU": model.name(rng, class_name),
+                "SYMBOL": f"S{n:0{width}d}",
+                "KOD_KRESKOWY": _ean13(f"590{n:09d}"),
+                "SYMBOL_JED": rng.choice(_UNITS),
+                "NAZWA_VAT": rng.choice(["23", "23", "23", "8", "5"]),
+                "ID_TYP_TOWAR": 1,
+                "WAGA": f"{rng.uniform(0.05, 30):.3f}",
+                "CZY_BLOKADA": "N",
+                "DATA_UTWORZENIA": created.strftime("%Y-%m-%d %H:%M:%S"),
+                "DATA_MODYFIKACJI": min(modified, datetime(2025, 1, 1)).strftime("%Y-%m-%d %H:%M:%S"),
+            })
+            counts["TOWARY.csv"] += 1
+
+            if n % 100_000 == 0:
+                print(f"  {n:,} / {products:,} products", file=sys.stderr)
+    finally:
+        for f in files.values():
+            f.close()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=str(root_dir / "data" / "inwent_tables_csv"))
+    parser.add_argument("-o", "--output", required=True, help="output directory")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", type=float, default=10, help="multiple of the source product count")
+    size.add_argument("--products", type=int, help="exact number of products")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    model = Model(Path(args.source))
+    products = args.products or int(len(model.source_products) * args.scale)
+    counts = generate(model, Path(args.output), products, random.Random(args.seed))
+    for name, count in sorted(counts.items()):
+        print(f"✅ {Path(args.output) / name}: {count:,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Report what each Lambda function imports on a cold start.
+
+    python tools/import_report.py
+    python tools/import_report.py get_items --depth 4 --min-ms 1
+    python tools/import_report.py --layer lambda_layers/python --budget-ms 400
+
+Runs `import main` of every lambda-functions/*/main.py (or the functions
+named) in a fresh interpreter under `python -X importtime`, with the
+function folder first on sys.path as in Lambda, and prints the cumulative
+import tree below main: children sorted by cumulative time, cut at --depth
+and below --min-ms. The figures are this machine's, not Lambda's; compare
+runs, not absolute numbers. Module-level code (boto3 clients, tables) runs
+during the import and is counted in main's own time.
+
+Environment variables the functions read at import time get placeholder
+values unless already set. --layer adds a built layer folder after the
+function folder, like /opt/python. --budget-ms exits with status 1 when a
+function's import of main takes longer.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+functions_dir = root_dir / "lambda-functions"
+
+PLACEHOLDER_ENV = {
+    "AWS_DEFAULT_REGION": "eu-central-1",
+    "TABLE_NAME": "import-report",
+    "USERS_TABLE": "import-report",
+    "USER_POOL_ID": "eu-central-1_importreport",
+}
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+class Node:
+    def __init__(self, name, self_us, cumulative_us):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = []
+
+
+def parse_importtime(stderr):
+    """
+    Root nodes of the `-X importtime` output. A module's line comes after
+    those of the modules it imported, one indentation step (two spaces)
+    deeper.
+    """
+    pending = {}
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        level = len(m.group(3)) // 2
+        node = Node(m.group(4), int(m.group(1)), int(m.group(2)))
+        node.children = pending.pop(level + 1, [])
+        pending.setdefault(level, []).append(node)
+    return pending.get(0, [])
+
+
+def import_main(fn_dir, layer=None):
+    paths = [str(fn_dir)] + ([str(layer)] if layer else [])
+    env = {**PLACEHOLDER_ENV, **os.environ}
+    code = f"import sys; sys.path[:0] = {paths!r}; import main"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=fn_dir, env=env, capture_output=True, text=True)
+    roots = parse_importtime(proc.stderr)
+    main = next((n for n in roots if n.name == "main"), None)
+    if proc.returncode or main is None:
+        tail = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("\n".join(tail[-5:]) or f"exit status {proc.returncode}")
+    return main
+
+
+def print_tree(node, depth, min_us, indent=0):
+    print(f"{node.cumulative_us / 1000:>9.1f} {node.self_us / 1000:>8.1f}  {'  ' * indent}{node.name}")
+    if indent >= depth:
+        return
+    for child in sorted(node.children, key=lambda n: n.cumulative_us, reverse=True):
+        if child.cumulative_us >= min_us:
+            print_tree(child, depth, min_us, indent + 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("functions", nargs="*", help="function folder names (default: all with a main.py)")
+    parser.add_argument("--layer", help="built layer folder to put after the function folder")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--min-ms", type=float, default=5.0, help="hide modules faster than this")
+    parser.add_argument("--budget-ms", type=float, help="fail when importing main takes longer")
+    args = parser.parse_args(argv)
+
+    fn_dirs = [functions_dir / name for name in args.functions] if args.functions \
+        else sorted(p.parent for p in functions_dir.glob("*/main.py"))
+    layer = Path(args.layer).resolve() if args.layer else None
+
+    failed = []
+    for fn_dir in fn_dirs:
+        print(f"\n{fn_dir.name}")
+        print(f"{'cum ms':>9} {'self ms':>8}  module")
+        try:
+            tree = import_main(fn_dir, layer)
+        except RuntimeError as e:
+            print(f"❌ {fn_dir.name}: import failed\n{e}")
+            failed.append(fn_dir.name)
+            continue
+        print_tree(tree, args.depth, args.min_ms * 1000)
+
+        total_ms = tree.cumulative_us / 1000
+        if args.budget_ms is not None:
+            if total_ms > args.budget_ms:
+                print(f"❌ {fn_dir.name}: {total_ms:.1f} ms over the {args.budget_ms:g} ms budget")
+                failed.append(fn_dir.name)
+            else:
+                print(f"✅ {fn_dir.name}: {total_ms:.1f} ms within the {args.budget_ms:g} ms budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())